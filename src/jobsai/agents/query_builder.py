@@ -19,10 +19,15 @@ from jobsai.config.prompts import (
     QUERY_BUILDER_USER_PROMPT as USER_PROMPT_BASE,
 )
 
-from jobsai.utils.llms import call_llm, extract_json
+from jobsai.utils.llms import call_llm, extract_json_streaming
 
 logger = logging.getLogger(__name__)
 
+# Token budget for the keywords response
+# 10 two-word queries in a JSON object fit comfortably in ~150 tokens;
+# a tight budget keeps generation latency down
+KEYWORDS_MAX_TOKENS = 300
+
 
 class QueryBuilderAgent:
     """Agent responsible for generating job search keywords from candidate profiles.
@@ -70,11 +75,21 @@ class QueryBuilderAgent:
             try:
                 # Call LLM to generate keywords
                 # The LLM is instructed to return a dictionary of 10 search queries
-                raw_response = call_llm(SYSTEM_PROMPT, USER_PROMPT)
-
-                # Extract JSON from the LLM response
-                # LLMs often wrap JSON in markdown code blocks or add extra text
-                json_text = extract_json(raw_response)
+                # JSON mode makes the model emit a bare JSON object and stop once it is closed
+                # The response is streamed, so the JSON object is scanned as it arrives
+                chunks = call_llm(
+                    SYSTEM_PROMPT,
+                    USER_PROMPT,
+                    max_tokens=KEYWORDS_MAX_TOKENS,
+                    stream=True,
+                    response_format={"type": "json_object"},
+                )
+
+                # Extract JSON from the streamed LLM response
+                # JSON mode returns a bare object, but older models may still
+                # wrap JSON in markdown code blocks or add extra text
+                # The stream is closed as soon as the object's braces balance
+                json_text = extract_json_streaming(chunks)
                 if json_text is None:
                     if attempt < max_retries:
                         logger.warning(
@@ -84,8 +99,7 @@ class QueryBuilderAgent:
                         continue
                     else:
                         logger.error(
-                            f" LLM failed to return parseable JSON after {max_retries + 1} attempts. "
-                            f"Raw response: {raw_response[:500]}"
+                            f" LLM failed to return parseable JSON after {max_retries + 1} attempts."
                         )
                         raise ValueError(
                             "LLM did not return parseable JSON for keywords after multiple attempts. "
@@ -16,7 +16,7 @@ The scoring process:
 import os
 import logging
 import json
-from typing import List, Dict, Optional, Callable
+from typing import List, Dict, Optional, Callable, Tuple
 
 from jobsai.config.paths import SCORED_JOB_LISTING_PATH
 from jobsai.utils.exceptions import CancellationError
@@ -103,7 +103,9 @@ class ScorerService:
     # Internal functions
     # ------------------------------
 
-    def _score_job_against_tech_stack(self, job: Dict, tech_stack: List[str]) -> Dict:
+    def _score_job_against_tech_stack(
+        self, job: Dict, tech_stack: List[Tuple[str, str]]
+    ) -> Dict:
         """
         Score a single job against a tech stack.
 
@@ -112,7 +114,9 @@ class ScorerService:
                 - "title": Job title
                 - "description_snippet": Short description from search results
                 - "full_description": Full job description (if deep mode was used)
-            tech_stack (List[str]): The flattened list of technology names to match.
+            tech_stack (List[Tuple[str, str]]): The flattened tech stack as
+                (technology name, lowercased technology name) pairs. Lowercasing
+                once up front avoids repeating it for every job.
 
         Returns:
             Dict: The job dictionary with added fields:
@@ -131,12 +135,16 @@ class ScorerService:
             ]
         ).lower()
 
-        # Find technologies from candidate's tech stack that appear in job description
+        # Split the candidate's tech stack into technologies that appear in the
+        # job description and technologies that don't, in a single pass
         # Uses simple substring matching (case-insensitive)
-        matched_skills = [tech for tech in tech_stack if tech.lower() in job_text]
-
-        # Identify technologies not found in the job description
-        missing_skills = [tech for tech in tech_stack if tech.lower() not in job_text]
+        matched_skills = []
+        missing_skills = []
+        for tech, tech_lower in tech_stack:
+            if tech_lower in job_text:
+                matched_skills.append(tech)
+            else:
+                missing_skills.append(tech)
 
         # Calculate relevancy score as percentage of matched technologies
         # Formula: (matched_skills / total_skills) * 100
@@ -209,7 +217,12 @@ class ScorerService:
                 flattened_tech_stack.append(category)
 
         # Normalize the tech stack (deduplicate, standardize capitalization)
-        flattened_tech_stack = normalize_list(flattened_tech_stack)
+        # and pair each technology with its lowercased form for matching
+        # (only strings are collected above, so the type check can be skipped)
+        flattened_tech_stack = [
+            (tech, tech.lower())
+            for tech in normalize_list(flattened_tech_stack, all_strings=True)
+        ]
 
         # Score each job against the tech stack
         scored_jobs = []
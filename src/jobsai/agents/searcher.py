@@ -7,7 +7,7 @@ service supports multiple job boards (Duunitori, Jobly) and can operate in
 "deep mode" to fetch full job descriptions.
 
 The service:
-1. Searches each job board with each keyword query
+1. Searches each job board with each keyword query (the boards in parallel)
 2. Saves raw job listings to disk for debugging
 3. Deduplicates jobs across queries and boards (by URL)
 4. Returns a consolidated list of unique job listings
@@ -16,9 +16,12 @@ The service:
 import os
 import logging
 import json
+import threading
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from typing import List, Dict, Optional, Callable
 
 from jobsai.config.paths import RAW_JOB_LISTING_PATH
+from jobsai.utils.cache import load_job_details, save_job_details
 from jobsai.utils.exceptions import CancellationError
 
 from jobsai.utils.scrapers.duunitori import scrape_duunitori
@@ -64,15 +67,16 @@ class SearcherService:
         """Search all specified job boards using candidate-generated keywords.
 
         Executes searches across multiple job boards with each keyword query.
-        Each search result is saved to disk for debugging, and all results are
-        deduplicated before returning.
+        The job boards are searched in parallel. Each search result is saved to
+        disk for debugging, and all results are deduplicated before returning.
 
         Args:
             keywords (List[str]): List of search keywords generated from
                 candidate profile (e.g., ["ai engineer", "software engineer"]).
                 Typically 10 keywords per candidate.
             job_boards (List[str]): List of job board names to search.
-                Supported: "Duunitori", "Jobly" (case-insensitive).
+                Supported: "Duunitori", "Jobly" (case-insensitive, each board is
+                searched once even if listed several times).
             deep_mode (bool): If True, fetches full job descriptions for each
                 listing. If False, only fetches description snippets.
                 Deep mode provides better matching accuracy but is slower.
@@ -92,58 +96,143 @@ class SearcherService:
         Raises:
             CancellationError: If cancellation_check returns True during execution
         """
-        all_jobs = []
+        # Full job descriptions by job URL, shared between the queries (and boards)
+        # so that a job found by several queries is fetched only once in deep mode
+        # Descriptions fetched by recent runs are loaded from the disk cache
+        detail_cache = load_job_details() if deep_mode else {}
+
+        # Search each job board once, even if it is listed several times
+        # (two threads scraping the same website would double the load on it)
+        unique_boards = {}
+        for job_board in job_boards:
+            unique_boards.setdefault(job_board.lower(), job_board)
+        job_boards = list(unique_boards.values())
+
+        # Set when a board fails, so that the other boards stop at their next
+        # cancellation check instead of finishing their whole crawl
+        failed = threading.Event()
+
+        def board_cancellation_check() -> bool:
+            return failed.is_set() or bool(cancellation_check and cancellation_check())
+
+        # Each job board is searched on its own thread
+        # The boards are independent websites, so searching them in parallel doesn't
+        # increase the load on any of them (each board still runs its queries one
+        # after another)
+        with ThreadPoolExecutor(max_workers=max(1, len(job_boards))) as executor:
+            futures = [
+                executor.submit(
+                    self._search_board,
+                    job_board,
+                    keywords,
+                    deep_mode,
+                    board_cancellation_check,
+                    detail_cache,
+                )
+                for job_board in job_boards
+            ]
+
+            # Surface the first failure (or cancellation) as soon as it happens
+            done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+            errors = [
+                future.exception()
+                for future in futures
+                if future in done and future.exception() is not None
+            ]
+            if errors:
+                failed.set()
+                raise errors[0]
+
+            board_results = [future.result() for future in futures]
+
+        if deep_mode:
+            save_job_details(detail_cache)
+
+        # Collect the jobs in the same order as searching all boards × all keywords
+        # one after another would
+        all_jobs = [
+            job
+            for query_index in range(len(keywords))
+            for jobs_by_query in board_results
+            for job in jobs_by_query[query_index]
+        ]
+
+        # Remove duplicate jobs (same URL may appear from multiple queries/boards)
+        return self._deduplicate_jobs(all_jobs)
+
+    # ------------------------------
+    # Internal functions
+    # ------------------------------
+
+    def _search_board(
+        self,
+        job_board: str,
+        keywords: List[str],
+        deep_mode: bool,
+        cancellation_check: Optional[Callable[[], bool]],
+        detail_cache: Dict[str, str],
+    ) -> List[List[Dict]]:
+        """Search one job board with each keyword query.
+
+        Each search result is saved to disk for debugging.
+
+        Args:
+            job_board (str): Job board name ("Duunitori" or "Jobly", case-insensitive).
+            keywords (List[str]): Search keywords generated from candidate profile.
+            deep_mode (bool): If True, fetches full job descriptions for each listing.
+            cancellation_check (Optional[Callable[[], bool]]): Optional callable
+                that returns True if the operation should be cancelled. Checked
+                before and after each query.
+            detail_cache (Dict[str, str]): Full job descriptions by job URL,
+                shared between the queries and boards.
+
+        Returns:
+            List[List[Dict]]: The job listings found with each query (in keyword order)
+
+        Raises:
+            CancellationError: If cancellation_check returns True during execution
+        """
+        results = []
 
-        # Search each job board with each keyword query
-        # This creates a cartesian product: all boards × all keywords
         for query in keywords:
             # Check for cancellation before processing each query
             if cancellation_check and cancellation_check():
                 logger.info(" Job search cancelled by user")
                 raise CancellationError("Pipeline cancelled during job search")
 
-            for job_board in job_boards:
-                # Check for cancellation before processing each job board
-                if cancellation_check and cancellation_check():
-                    logger.info(" Job search cancelled by user")
-                    raise CancellationError("Pipeline cancelled during job search")
-
-                logger.info(" Searching %s for query '%s'", job_board, query)
-
-                # Route to appropriate scraper based on job board name
-                # Pass cancellation_check to scrapers for checking during long operations
-                if job_board.lower() == "duunitori":
-                    jobs = scrape_duunitori(
-                        query,
-                        deep_mode=deep_mode,
-                        cancellation_check=cancellation_check,
-                    )
-                elif job_board.lower() == "jobly":
-                    jobs = scrape_jobly(
-                        query,
-                        deep_mode=deep_mode,
-                        cancellation_check=cancellation_check,
-                    )
-                else:
-                    # Unknown job board - skip with empty result
-                    logger.warning(f" Unknown job board: {job_board}. Skipping.")
-                    jobs = []
-
-                # Check for cancellation after scraping (before saving)
-                if cancellation_check and cancellation_check():
-                    logger.info(" Job search cancelled by user")
-                    raise CancellationError("Pipeline cancelled during job search")
-
-                # Collect jobs and save to disk for debugging
-                all_jobs.extend(jobs)
-                self._save_raw_jobs(jobs, job_board, query)
+            logger.info(" Searching %s for query '%s'", job_board, query)
+
+            # Route to appropriate scraper based on job board name
+            # Pass cancellation_check to scrapers for checking during long operations
+            if job_board.lower() == "duunitori":
+                jobs = scrape_duunitori(
+                    query,
+                    deep_mode=deep_mode,
+                    cancellation_check=cancellation_check,
+                    detail_cache=detail_cache,
+                )
+            elif job_board.lower() == "jobly":
+                jobs = scrape_jobly(
+                    query,
+                    deep_mode=deep_mode,
+                    cancellation_check=cancellation_check,
+                    detail_cache=detail_cache,
+                )
+            else:
+                # Unknown job board - skip with empty result
+                logger.warning(f" Unknown job board: {job_board}. Skipping.")
+                jobs = []
+
+            # Check for cancellation after scraping (before saving)
+            if cancellation_check and cancellation_check():
+                logger.info(" Job search cancelled by user")
+                raise CancellationError("Pipeline cancelled during job search")
 
-        # Remove duplicate jobs (same URL may appear from multiple queries/boards)
-        return self._deduplicate_jobs(all_jobs)
+            # Collect jobs and save to disk for debugging
+            results.append(jobs)
+            self._save_raw_jobs(jobs, job_board, query)
 
-    # ------------------------------
-    # Internal functions
-    # ------------------------------
+        return results
 
     def _save_raw_jobs(self, jobs: List[Dict], board: str, query: str) -> None:
         """Save raw job listings to disk for debugging and record-keeping.
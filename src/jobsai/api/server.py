@@ -31,6 +31,10 @@ import jobsai.main as backend
 from jobsai.config.schemas import FrontendPayload
 from jobsai.utils.exceptions import CancellationError
 
+# The server is the application entry point, so it owns the logging configuration
+# (library modules such as jobsai.main only create loggers)
+logging.basicConfig(level=logging.INFO)
+
 logger = logging.getLogger(__name__)
 
 # ------------- State Management -------------
@@ -31,6 +31,10 @@ JOB_ANALYSIS_PATH = Path("src/jobsai/data/job_analyses/")
 # Files are named: {timestamp}_cover_letter.docx
 COVER_LETTER_PATH = Path("src/jobsai/data/cover_letters/")
 
+# Path where cached LLM results are stored
+# Files are named: {namespace}_{key}.json.gz
+LLM_CACHE_PATH = Path("src/jobsai/data/cache/")
+
 # Create all directories if they don't exist
 # This ensures the system works even on first run
 SKILL_PROFILE_PATH.mkdir(parents=True, exist_ok=True)
@@ -38,6 +42,7 @@ RAW_JOB_LISTING_PATH.mkdir(parents=True, exist_ok=True)
 SCORED_JOB_LISTING_PATH.mkdir(parents=True, exist_ok=True)
 JOB_ANALYSIS_PATH.mkdir(parents=True, exist_ok=True)
 COVER_LETTER_PATH.mkdir(parents=True, exist_ok=True)
+LLM_CACHE_PATH.mkdir(parents=True, exist_ok=True)
 
 # ----- URLS -----
 
@@ -120,7 +120,7 @@ You will receive a candidate profile (4–5 paragraph string of text) as input.
 
 Your task is to build 10 job search queries from the candidate profile.
 
-Your response should be a iterable dictionary of 10 job search queries:
+Your response should be a JSON object (an iterable dictionary) of 10 job search queries:
     {query1: "query1", query2: "query2", query3: "query3", query4: "query4", query5: "query5", query6: "query6", query7: "query7", query8: "query8", query9: "query9", query10: "query10"}
 
 Each query should be a two-word phrase.
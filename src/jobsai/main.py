@@ -11,16 +11,16 @@ It orchestrates the complete workflow from form submissions to cover letter gene
 5. AnalyzerAgent: Analyzes top-scoring jobs and generates cover letter instructions
 6. GeneratorAgent: Generates personalized cover letter document
 
-The pipeline uses a decorator-based approach for consistent error handling and logging
-across all steps.
+The pipeline is described as a data-driven list of steps, each run through a
+single helper for consistent error handling and logging across all steps.
 
 For overall project description, see README.md or docs/README.md.
 """
 
 import logging
 from datetime import datetime
-from typing import Dict, Callable, Any, Optional
-from functools import wraps
+from typing import Dict, Callable, Any, Optional, List
+from functools import partial
 
 from jobsai.agents import (
     ProfilerAgent,
@@ -32,43 +32,63 @@ from jobsai.agents import (
 )
 
 from jobsai.utils.form_data import extract_form_data
+from jobsai.utils.cache import cached
 from jobsai.utils.exceptions import CancellationError
 
-logging.basicConfig(level=logging.INFO)
-
 logger = logging.getLogger(__name__)
 
 
-def pipeline_step(step_name: str, step_number: int, total_steps: int):
+def _run_step(
+    step_name: str, step_number: int, total_steps: int, func: Callable, *args, **kwargs
+) -> Any:
     """
-    Decorator for pipeline steps that provides consistent error handling and logging.
+    Run a single pipeline step with consistent error handling and logging.
 
     Args:
         step_name: Human-readable name of the step
         step_number: Step number (1-indexed)
         total_steps: Total number of steps in pipeline
-    """
+        func: The callable implementing the step
+        *args, **kwargs: Arguments passed to func
 
-    def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(*args, **kwargs) -> Any:
-            try:
-                logger.info(f" Step {step_number}/{total_steps}: {step_name}...")
-                result = func(*args, **kwargs)
-                logger.info(
-                    f" Step {step_number}/{total_steps}: {step_name} completed successfully"
-                )
-                return result
-            except Exception as e:
-                error_msg = (
-                    f" Step {step_number}/{total_steps}: {step_name} failed: {str(e)}"
-                )
-                logger.error(error_msg)
-                raise RuntimeError(error_msg) from e
+    Returns:
+        Any: The return value of func
+
+    Raises:
+        CancellationError: If the step was cancelled (propagated as is)
+        RuntimeError: If the step fails for any other reason
+    """
+    try:
+        logger.info(" Step %d/%d: %s...", step_number, total_steps, step_name)
+        result = func(*args, **kwargs)
+        logger.info(
+            " Step %d/%d: %s completed successfully",
+            step_number,
+            total_steps,
+            step_name,
+        )
+        return result
+    except CancellationError:
+        raise
+    except Exception as e:
+        error_msg = f" Step {step_number}/{total_steps}: {step_name} failed: {str(e)}"
+        logger.error(error_msg)
+        raise RuntimeError(error_msg) from e
 
-        return wrapper
 
-    return decorator
+def _score_jobs(
+    scorer: ScorerService,
+    raw_jobs: List[Dict],
+    tech_stack: List,
+    cancellation_check: Optional[Callable[[], bool]],
+) -> List[Dict]:
+    """Score the jobs and fail the step if nothing could be scored."""
+    scored = scorer.score_jobs(raw_jobs, tech_stack, cancellation_check)
+    if not scored:
+        raise ValueError(
+            "No jobs were scored. This may indicate an issue with job search or scoring logic."
+        )
+    return scored
 
 
 def main(
@@ -116,11 +136,11 @@ def main(
     cover_letter_num = answers["cover_letter_num"]
     cover_letter_style = answers["cover_letter_style"]
     tech_stack = answers["tech_stack"]
-    print("JOB BOARDS: ", job_boards)
-    print("DEEP MODE: ", deep_mode)
-    print("COVER LETTER NUM: ", cover_letter_num)
-    print("COVER LETTER STYLE: ", cover_letter_style)
-    print("TECH STACK: ", tech_stack)
+    logger.debug(" Job boards: %s", job_boards)
+    logger.debug(" Deep mode: %s", deep_mode)
+    logger.debug(" Cover letter num: %s", cover_letter_num)
+    logger.debug(" Cover letter style: %s", cover_letter_style)
+    logger.debug(" Tech stack: %s", tech_stack)
 
     # Generate a timestamp for consistent file naming
     # Used throughout the pipeline to insert the same datetime to all output files
@@ -152,123 +172,99 @@ def main(
     if cancellation_check and cancellation_check():
         raise CancellationError("Pipeline cancelled before start")
 
-    # Step 1: Profile the candidate
-    # Uses LLM to extract the candidate's skills and experience from the form submissions
-    # Returns a string of the candidate profile (e.g. "John Doe is a software engineer with 5 years of experience in Python and Java.")
-    if progress_callback:
-        progress_callback("profiling", "Creating your profile...")
-
-    @pipeline_step("Profiling candidate", 1, 6)
-    def _step1_profile():
-        if cancellation_check and cancellation_check():
-            raise CancellationError("Pipeline cancelled during profiling")
-        return profiler.create_profile(form_submissions)
-
-    profile = _step1_profile()
-
-    # Step 2: Create search keywords
-    # Uses LLM to create search keywords from the candidate profile
-    # Returns a list of search keywords (e.g. ["ai engineer", "software engineer", "data scientist"])
-    if cancellation_check and cancellation_check():
-        raise CancellationError("Pipeline cancelled before keyword creation")
-
-    @pipeline_step("Creating keywords", 2, 6)
-    def _step2_keywords():
-        if cancellation_check and cancellation_check():
-            raise CancellationError("Pipeline cancelled during keyword creation")
-        return query_builder.create_keywords(profile)
-
-    keywords = _step2_keywords()
-
-    # Step 3: Search job boards
-    # Searches job boards for relevant jobs using the search keywords
-    # Returns a list of raw job listings
-    # (e.g. [{"title": "Software Engineer", "company": "Google", "location": "San Francisco", "url": "https://www.google.com", "description_snippet": "We are looking for a software engineer with 5 years of experience in Python and Java."}])
-    # The raw jobs are also saved to /src/jobsai/data/job_listings/raw/{timestamp}_{job_board}_{query}.json for convenience
-    if progress_callback:
-        progress_callback("searching", "Searching for jobs...")
-
-    if cancellation_check and cancellation_check():
-        raise CancellationError("Pipeline cancelled before job search")
-
-    @pipeline_step("Searching jobs", 3, 6)
-    def _step3_search():
-        if cancellation_check and cancellation_check():
-            raise CancellationError("Pipeline cancelled during job search")
-        # Pass cancellation_check to searcher for checking during long operations
-        return searcher.search_jobs(keywords, job_boards, deep_mode, cancellation_check)
-
-    raw_jobs = _step3_search()
-
-    # Step 4: Score job listings
-    # Scores the job listings based on the candidate's technology stack
-    # Returns a list of scored job listings
-    # (e.g. [{"title": "Software Engineer", "company": "Google", "location": "San Francisco", "url": "https://www.google.com", "description_snippet": "We are looking for a software engineer with 5 years of experience in Python and Java.", "score": 80}])
-    # The scored jobs are also saved to /src/jobsai/data/job_listings/scored/{timestamp}_scored_jobs.json for convenience
-    if progress_callback:
-        progress_callback("scoring", "Scoring the jobs...")
-
-    if cancellation_check and cancellation_check():
-        raise CancellationError("Pipeline cancelled before scoring")
-
-    @pipeline_step("Scoring jobs", 4, 6)
-    def _step4_score():
-        if cancellation_check and cancellation_check():
-            raise CancellationError("Pipeline cancelled during scoring")
-        # Pass cancellation_check to scorer for checking during job processing loop
-        scored = scorer.score_jobs(raw_jobs, tech_stack, cancellation_check)
-        if not scored:
-            raise ValueError(
-                "No jobs were scored. This may indicate an issue with job search or scoring logic."
-            )
-        return scored
-
-    scored_jobs = _step4_score()
-
-    # Step 5: Write an analysis on top-scoring jobs
-    # Uses LLM to create personalized cover letter instructions for each job
-    # Returns a string of the job analysis
-    # (e.g. "The top-scoring job is for a software engineer at Google in San Francisco. The job analysis is: We are looking for a software engineer with 5 years of experience in Python and Java.")
-    # The job analysis is also saved to /src/jobsai/data/job_analyses/{timestamp}_job_analysis.txt for convenience
-    if progress_callback:
-        progress_callback("analyzing", "Doing analysis...")
+    # Pipeline state shared between the steps
+    # Each step reads its inputs from the state and stores its output under its own key
+    state = {
+        "form_submissions": form_submissions,
+        "job_boards": job_boards,
+        "deep_mode": deep_mode,
+        "cover_letter_num": cover_letter_num,
+        "cover_letter_style": cover_letter_style,
+        "tech_stack": tech_stack,
+        "cancellation_check": cancellation_check,
+    }
 
-    if cancellation_check and cancellation_check():
-        raise CancellationError("Pipeline cancelled before analysis")
+    # The pipeline steps, in execution order:
+    # (step name, progress update, output key, step function, input keys)
+    #
+    # 1. Profile: LLM extracts the candidate's skills and experience from the form submissions
+    #    (cached on disk by form submissions, see jobsai.utils.cache)
+    # 2. Keywords: LLM creates search keywords from the candidate profile
+    #    (cached on disk by profile, so the cache is invalidated when the profile changes)
+    # 3. Search: Searches job boards with the keywords
+    #    (raw jobs are also saved to /src/jobsai/data/job_listings/raw/)
+    # 4. Score: Scores the job listings against the candidate's technology stack
+    #    (scored jobs are also saved to /src/jobsai/data/job_listings/scored/)
+    # 5. Analyze: LLM writes cover letter instructions for the top-scoring jobs
+    #    (the analysis is also saved to /src/jobsai/data/job_analyses/)
+    # 6. Generate: LLM writes the cover letters into a Document object
+    #    (the document is also saved to /src/jobsai/data/cover_letters/)
+    steps = [
+        (
+            "Profiling candidate",
+            ("profiling", "Creating your profile..."),
+            "profile",
+            cached("profile", profiler.create_profile),
+            ("form_submissions",),
+        ),
+        (
+            "Creating keywords",
+            None,
+            "keywords",
+            cached("keywords", query_builder.create_keywords),
+            ("profile",),
+        ),
+        (
+            "Searching jobs",
+            ("searching", "Searching for jobs..."),
+            "raw_jobs",
+            searcher.search_jobs,
+            ("keywords", "job_boards", "deep_mode", "cancellation_check"),
+        ),
+        (
+            "Scoring jobs",
+            ("scoring", "Scoring the jobs..."),
+            "scored_jobs",
+            partial(_score_jobs, scorer),
+            ("raw_jobs", "tech_stack", "cancellation_check"),
+        ),
+        (
+            "Analyzing jobs",
+            ("analyzing", "Doing analysis..."),
+            "job_analysis",
+            analyzer.write_analysis,
+            ("scored_jobs", "profile", "cover_letter_num", "cancellation_check"),
+        ),
+        (
+            "Generating cover letters",
+            ("generating", "Generating cover letters for you..."),
+            "cover_letters",
+            generator.generate_letters,
+            ("job_analysis", "profile", "cover_letter_style"),
+        ),
+    ]
+
+    for step_number, (step_name, progress, output_key, func, input_keys) in enumerate(
+        steps, 1
+    ):
+        if progress_callback and progress:
+            progress_callback(*progress)
 
-    @pipeline_step("Analyzing jobs", 5, 6)
-    def _step5_analyze():
         if cancellation_check and cancellation_check():
-            raise CancellationError("Pipeline cancelled during analysis")
-        # Pass cancellation_check to analyzer for checking during LLM calls in loop
-        return analyzer.write_analysis(
-            scored_jobs, profile, cover_letter_num, cancellation_check
+            raise CancellationError(f"Pipeline cancelled before {step_name.lower()}")
+
+        state[output_key] = _run_step(
+            step_name,
+            step_number,
+            len(steps),
+            func,
+            *(state[key] for key in input_keys),
         )
 
-    job_analysis = _step5_analyze()
-
-    # Step 6: Generate cover letter document
-    # Uses LLM to write cover letter based on the candidate profile, the job analysis and the cover letter style
-    # Returns a Document object
-    # The document is also saved to /src/jobsai/data/cover_letters/{timestamp}_cover_letter.docx for convenience
-    if progress_callback:
-        progress_callback("generating", "Generating cover letters for you...")
-
-    if cancellation_check and cancellation_check():
-        raise CancellationError("Pipeline cancelled before generation")
-
-    @pipeline_step("Generating cover letters", 6, 6)
-    def _step6_generate():
-        if cancellation_check and cancellation_check():
-            raise CancellationError("Pipeline cancelled during generation")
-        return generator.generate_letters(job_analysis, profile, cover_letter_style)
-
-    cover_letters = _step6_generate()
-
     # Return document and metadata for API response
     logger.info(" Pipeline completed successfully")
     return {
-        "document": cover_letters,
+        "document": state["cover_letters"],
         "timestamp": timestamp,
         "filename": f"{timestamp}_cover_letter.docx",
     }
@@ -276,4 +272,6 @@ def main(
 
 # For running as standalone
 if __name__ == "__main__":
+    # Logging is configured by the application entry point, not on import
+    logging.basicConfig(level=logging.INFO)
     main({})
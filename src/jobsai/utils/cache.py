@@ -0,0 +1,220 @@
+"""
+Persistent Disk Cache for LLM Results and Job Descriptions.
+
+This module provides a small file-based cache for pipeline steps whose output
+depends only on their input, such as the candidate profile (derived from the
+form submissions) and the search keywords (derived from the profile). Users
+typically re-run the pipeline with unchanged personal data to tweak the style
+or the job boards, so caching these steps skips their LLM roundtrips.
+
+The full job descriptions fetched by the scrapers in deep mode are cached as
+well. Job postings rarely change once published, so a re-run within
+JOB_DETAILS_MAX_AGE reuses the descriptions instead of downloading every job
+detail page again.
+
+Cache entries are stored as gzip-compressed JSON files under LLM_CACHE_PATH,
+keyed by a SHA-256 hash of the canonical JSON serialization of the step input.
+LLM output is plain English/JSON text, which compresses several times over,
+so compression keeps the cache small on disk and in the OS page cache.
+
+Caching can be disabled by setting the JOBSAI_NO_CACHE environment variable
+to a non-empty value.
+
+Functions:
+    cache_key: Compute a stable cache key for JSON-serializable data
+    cached: Wrap a function so that its results are cached on disk
+    load_job_details: Load the cached job descriptions that haven't expired
+    save_job_details: Add fetched job descriptions to the cache
+"""
+
+import os
+import time
+import gzip
+import json
+import logging
+import hashlib
+import tempfile
+from functools import wraps
+from typing import Any, Callable, Dict, Optional
+
+from jobsai.config.paths import LLM_CACHE_PATH
+
+logger = logging.getLogger(__name__)
+
+# How long (in seconds) a cached job description stays valid
+JOB_DETAILS_MAX_AGE = 24 * 60 * 60
+
+
+# ------------------------------
+# Public interface
+# ------------------------------
+def cache_key(data: Any) -> str:
+    """
+    Compute a stable cache key for JSON-serializable data.
+
+    Args:
+        data: The data to hash (e.g. form submissions or profile text)
+
+    Returns:
+        str: Hex SHA-256 digest of the canonical JSON serialization
+    """
+
+    canonical = json.dumps(
+        data, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def cached(namespace: str, func: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """
+    Wrap a single-argument function so that its results are cached on disk.
+
+    The cache key is derived from the function argument, so a changed input
+    (e.g. a new profile) automatically misses the cache.
+
+    Args:
+        namespace: Name of the cached step, used as the filename prefix
+        func: The function to cache. Must take one JSON-serializable argument
+            and return a JSON-serializable result.
+
+    Returns:
+        Callable: The wrapped function
+    """
+
+    @wraps(func)
+    def wrapper(data: Any) -> Any:
+        if os.getenv("JOBSAI_NO_CACHE"):
+            return func(data)
+
+        key = cache_key(data)
+        result = _load(namespace, key)
+        if result is not None:
+            logger.info(" Using cached %s (%s)", namespace, key[:12])
+            return result
+
+        result = func(data)
+        _save(namespace, key, result)
+        return result
+
+    return wrapper
+
+
+def load_job_details(max_age: float = JOB_DETAILS_MAX_AGE) -> Dict[str, str]:
+    """
+    Load the cached full job descriptions that haven't expired.
+
+    The returned dictionary can be passed to the scrapers as their detail_cache.
+
+    Args:
+        max_age: Maximum age of a description in seconds
+
+    Returns:
+        Dict[str, str]: Job URL -> full description (empty if caching is disabled)
+    """
+
+    if os.getenv("JOBSAI_NO_CACHE"):
+        return {}
+
+    cutoff = time.time() - max_age
+    return {
+        url: description
+        for url, (fetched_at, description) in _load_job_detail_entries().items()
+        if fetched_at >= cutoff
+    }
+
+
+def save_job_details(
+    details: Dict[str, str], max_age: float = JOB_DETAILS_MAX_AGE
+) -> None:
+    """
+    Add fetched full job descriptions to the cache.
+
+    Descriptions already in the cache keep their original fetch time, so they
+    expire max_age after they were first downloaded. Expired entries and empty
+    descriptions (failed fetches) are dropped.
+
+    Args:
+        details: Job URL -> full description, e.g. a detail_cache filled by the scrapers
+        max_age: Maximum age of a description in seconds
+    """
+
+    if os.getenv("JOBSAI_NO_CACHE"):
+        return
+
+    now = time.time()
+    cutoff = now - max_age
+    entries = _load_job_detail_entries()
+    for url, description in details.items():
+        if description and url not in entries:
+            entries[url] = [now, description]
+    _save(
+        _JOB_DETAILS_NAMESPACE,
+        _JOB_DETAILS_KEY,
+        {url: entry for url, entry in entries.items() if entry[0] >= cutoff},
+    )
+
+
+# ------------------------------
+# Internal functions
+# ------------------------------
+
+# Compression level for cache entries
+# Low levels already get most of the ratio on text while keeping writes cheap
+_COMPRESSION_LEVEL = 3
+
+# All job descriptions are kept in a single cache entry
+_JOB_DETAILS_NAMESPACE = "job_details"
+_JOB_DETAILS_KEY = "all"
+
+
+def _cache_path(namespace: str, key: str) -> str:
+    """Return the path of the cache file for a namespace and key."""
+    return os.path.join(LLM_CACHE_PATH, f"{namespace}_{key}.json.gz")
+
+
+def _load(namespace: str, key: str) -> Optional[Any]:
+    """
+    Load a cached result.
+
+    Returns:
+        Optional[Any]: The cached result, or None on a cache miss or unreadable entry
+    """
+
+    path = _cache_path(namespace, key)
+    try:
+        with open(path, "rb") as f:
+            return json.loads(gzip.decompress(f.read()).decode("utf-8"))
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(" Ignoring unreadable cache entry %s: %s", path, e)
+        return None
+
+
+def _save(namespace: str, key: str, result: Any) -> None:
+    """Save a result to the cache. Failures are logged but never fatal."""
+
+    path = _cache_path(namespace, key)
+    tmp_path = None
+    try:
+        payload = json.dumps(result, ensure_ascii=False).encode("utf-8")
+        # Write to a uniquely named temporary file in the same directory first,
+        # so concurrent readers never see partial entries and concurrent
+        # writers never share a temporary file
+        with tempfile.NamedTemporaryFile(
+            dir=os.path.dirname(path), suffix=".tmp", delete=False
+        ) as f:
+            tmp_path = f.name
+            f.write(gzip.compress(payload, compresslevel=_COMPRESSION_LEVEL))
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.error(" Failed to save cache entry %s: %s", path, e)
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _load_job_detail_entries() -> Dict[str, list]:
+    """Load the cached job descriptions as job URL -> [fetch time, description]."""
+
+    entries = _load(_JOB_DETAILS_NAMESPACE, _JOB_DETAILS_KEY)
+    return entries if isinstance(entries, dict) else {}
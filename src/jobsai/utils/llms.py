@@ -5,8 +5,11 @@ This module provides utilities for interacting with OpenAI's LLM API and
 processing LLM responses. It includes:
 
 - call_llm: Central function for all LLM API calls with automatic retry logic
+  (optionally streaming the response token by token)
 - extract_json: Utility for extracting JSON from LLM responses that may be
   wrapped in markdown or contain extra text
+- extract_json_streaming: Streaming counterpart of extract_json that stops
+  consuming the response as soon as the JSON object is complete
 
 The module handles:
 - Environment variable validation
@@ -16,18 +19,35 @@ The module handles:
 """
 
 import os
+import re
 import logging
 import json
 import time
-from typing import Optional
+import random
+from typing import Optional, Dict, Iterable, Iterator, Literal, Tuple, Union, overload
 
+import httpx
 from dotenv import load_dotenv
 
-from openai import OpenAI
-from openai import RateLimitError, APIConnectionError, APITimeoutError
+from openai import OpenAI, DefaultHttpxClient
+from openai import (
+    RateLimitError,
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+)
+
+from jobsai.utils.rate_limiter import retry_after_delay
 
 logger = logging.getLogger(__name__)
 
+# Upper bound for the exponential backoff between LLM API retries (seconds)
+MAX_RETRY_DELAY = 60.0
+
+# Matches a single brace, used to scan for balanced JSON objects
+# Scanning with a compiled regex runs in C instead of a per-character Python loop
+_BRACE_RE = re.compile(r"[{}]")
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -53,15 +73,61 @@ if not OPENAI_API_KEY:
     logger.error(error_msg)
     raise ValueError(error_msg)
 
-# Initialize OpenAI client with validated API key
+# Connection pool for the OpenAI client
+# A pipeline run makes its LLM calls minutes apart (scraping happens in between),
+# so idle connections are kept alive much longer than httpx's 5 second default
+# to reuse the TCP+TLS connection instead of handshaking again on every call
+HTTP_CONNECTION_LIMITS = httpx.Limits(
+    max_connections=20,
+    max_keepalive_connections=20,
+    keepalive_expiry=300.0,
+)
+
+# Initialize a single module-level OpenAI client with validated API key
+# The client (and its connection pool) is shared by every LLM call in the process
 # This will raise an error immediately if the API key format is invalid
 try:
-    client = OpenAI(api_key=OPENAI_API_KEY)
+    client = OpenAI(
+        api_key=OPENAI_API_KEY,
+        http_client=DefaultHttpxClient(limits=HTTP_CONNECTION_LIMITS),
+    )
 except Exception as e:
     error_msg = f" Failed to initialize OpenAI client: {str(e)}"
     logger.error(error_msg)
     raise ValueError(error_msg) from e
 
+# The same client with the SDK's built-in retries disabled, used for chat completions
+# _create_completion retries transient failures itself (with jittered backoff and
+# logging), so SDK retries on top would multiply the attempts (3 requests per attempt)
+completion_client = client.with_options(max_retries=0)
+
+
+# call_llm returns the full text unless stream=True, in which case it returns
+# a generator of chunks. The overloads let type checkers see that distinction
+@overload
+def call_llm(
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int = ...,
+    max_retries: int = ...,
+    retry_delay: float = ...,
+    stream: Literal[False] = ...,
+    response_format: Optional[Dict] = ...,
+) -> str: ...
+
+
+@overload
+def call_llm(
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int = ...,
+    max_retries: int = ...,
+    retry_delay: float = ...,
+    *,
+    stream: Literal[True],
+    response_format: Optional[Dict] = ...,
+) -> Iterator[str]: ...
+
 
 def call_llm(
     system_prompt: str,
@@ -69,7 +135,9 @@ def call_llm(
     max_tokens: int = 800,
     max_retries: int = 3,
     retry_delay: float = 1.0,
-) -> str:
+    stream: bool = False,
+    response_format: Optional[Dict] = None,
+) -> Union[str, Iterator[str]]:
     """
     Call OpenAI LLM API with system and user prompts.
 
@@ -86,55 +154,35 @@ def call_llm(
         user_prompt (str): User prompt containing the actual task/input
         max_tokens (int): Maximum number of tokens in the response (default: 800)
         max_retries (int): Maximum number of retry attempts for transient failures (default: 3)
-        retry_delay (float): Initial delay between retries in seconds, doubles on each retry (default: 1.0)
+        retry_delay (float): Initial delay between retries in seconds, doubles on each retry
+            with random jitter; a Retry-After header from the API takes precedence (default: 1.0)
+        stream (bool): If True, return a generator that yields content chunks as
+            they arrive instead of waiting for the complete response (default: False)
+        response_format (Optional[Dict]): Optional OpenAI response format, e.g.
+            {"type": "json_object"} for JSON-emitting prompts. In JSON mode the
+            model stops as soon as the object is closed. The prompts must
+            mention JSON for the API to accept it. (default: None)
 
     Returns:
-        str: The complete LLM response text
+        str | Iterator[str]: The complete LLM response text, or a generator of
+            response text chunks if stream=True
 
     Raises:
         Exception: If OpenAI API call fails after all retries (handled by caller)
     """
 
-    retryable_errors = (RateLimitError, APIConnectionError, APITimeoutError)
-    last_exception = None
+    response = _create_completion(
+        system_prompt,
+        user_prompt,
+        max_tokens,
+        max_retries,
+        retry_delay,
+        stream,
+        response_format,
+    )
 
-    for attempt in range(max_retries + 1):
-        try:
-            # Make API call to OpenAI
-            # Temperature is set low (0.2) for more deterministic, focused responses
-            response = client.chat.completions.create(
-                model=OPENAI_MODEL,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                max_tokens=max_tokens,
-                temperature=0.2,  # Low temperature for consistent, focused output
-            )
-            break  # Success, exit retry loop
-
-        except retryable_errors as e:
-            last_exception = e
-            if attempt < max_retries:
-                # Exponential backoff: delay doubles with each retry
-                delay = retry_delay * (2**attempt)
-                logger.warning(
-                    f" LLM API call failed (attempt {attempt + 1}/{max_retries + 1}): {type(e).__name__}. "
-                    f"Retrying in {delay:.1f}s..."
-                )
-                time.sleep(delay)
-            else:
-                # Final attempt failed
-                logger.error(
-                    f" LLM API call failed after {max_retries + 1} attempts: {type(e).__name__}"
-                )
-                raise
-        except Exception as e:
-            # Non-retryable errors (e.g., authentication, invalid request) fail immediately
-            logger.error(
-                f" LLM API call failed with non-retryable error: {type(e).__name__}: {str(e)}"
-            )
-            raise
+    if stream:
+        return _iter_stream(response)
 
     # Validate response structure
     if not response or not hasattr(response, "choices"):
@@ -167,7 +215,9 @@ def call_llm(
         raise ValueError(error_msg)
 
     # Log first 500 characters for debugging (full response may be very long)
-    logger.debug(" LLM response: %s", text[:500])
+    # Guarded so the substring isn't built on every call when debug logging is off
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(" LLM response: %s", text[:500])
 
     return text
 
@@ -204,15 +254,9 @@ def extract_json(text: str) -> Optional[str]:
 
     # Balance braces to find the matching closing brace
     # This handles nested objects correctly
-    brace = 0
-    for i in range(start, len(text)):
-        if text[i] == "{":
-            brace += 1
-        elif text[i] == "}":
-            brace -= 1
-            # When braces are balanced, we've found the complete JSON object
-            if brace == 0:
-                return text[start : i + 1]
+    end = _balance_braces(text, start)
+    if end != -1:
+        return text[start:end]
 
     # Fallback: if brace balancing didn't work, try parsing the entire text
     # This handles cases where the text is already valid JSON
@@ -221,3 +265,237 @@ def extract_json(text: str) -> Optional[str]:
         return text
     except Exception:
         return None
+
+
+def extract_json_streaming(chunks: Iterable[str]) -> Optional[str]:
+    """
+    Extract a JSON object from a streamed LLM response.
+
+    Streaming counterpart of extract_json: consumes response chunks (e.g. from
+    call_llm(..., stream=True)) and returns as soon as the braces of the first
+    JSON object balance. If the chunk source has a close() method (such as the
+    generator returned by call_llm), it is closed at that point so that the
+    underlying OpenAI stream is cancelled and no further tokens are generated.
+
+    Args:
+        chunks (Iterable[str]): Response text chunks in arrival order
+
+    Returns:
+        Optional[str]:
+            - The extracted JSON string if a complete JSON object is found
+            - None if no valid JSON can be extracted
+
+    Example:
+        Input: ["Here is the profile: ```json\n{\"na", "me\": \"John\"}", "\n```"]
+        Output: '{"name": "John"}'
+    """
+
+    parts = []
+    brace = 0
+    started = False
+
+    try:
+        for chunk in chunks:
+            if not chunk:
+                continue
+
+            offset = 0
+            if not started:
+                # Skip everything before the first opening brace
+                offset = chunk.find("{")
+                if offset == -1:
+                    continue
+                started = True
+
+            # Balance braces within the chunk, same as extract_json
+            end, brace = _scan_braces(chunk, offset, brace)
+            if end != -1:
+                parts.append(chunk[offset:end])
+                return "".join(parts)
+
+            parts.append(chunk[offset:])
+    finally:
+        # Stop the upstream stream early once we have what we need
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+
+    # Stream ended without a balanced object
+    return None
+
+
+# ------------------------------
+# Internal functions
+# ------------------------------
+
+
+def _scan_braces(text: str, start: int, depth: int) -> Tuple[int, int]:
+    """
+    Scan text for the point where the brace depth returns to zero.
+
+    Only brace characters are visited; everything in between is skipped by
+    the regex engine.
+
+    Args:
+        text (str): The text to scan
+        start (int): Index to start scanning from
+        depth (int): Brace depth at the start index
+
+    Returns:
+        Tuple[int, int]: (end, depth) where end is the index just past the
+            balancing closing brace, or -1 if the braces don't balance within
+            the text, and depth is the brace depth at the end of the scan
+    """
+
+    for match in _BRACE_RE.finditer(text, start):
+        if match.group() == "{":
+            depth += 1
+        else:
+            depth -= 1
+            # When braces are balanced, we've found the complete JSON object
+            if depth == 0:
+                return match.end(), 0
+    return -1, depth
+
+
+def _balance_braces(text: str, start: int) -> int:
+    """
+    Find the end of the JSON object starting at the given opening brace.
+
+    Returns:
+        int: Index just past the matching closing brace, or -1 if unbalanced
+    """
+
+    return _scan_braces(text, start, 0)[0]
+
+
+def _create_completion(
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int,
+    max_retries: int,
+    retry_delay: float,
+    stream: bool,
+    response_format: Optional[Dict] = None,
+):
+    """
+    Create a chat completion, retrying transient failures with exponential backoff.
+
+    Args:
+        system_prompt (str): System prompt defining the LLM's role and behavior
+        user_prompt (str): User prompt containing the actual task/input
+        max_tokens (int): Maximum number of tokens in the response
+        max_retries (int): Maximum number of retry attempts for transient failures
+        retry_delay (float): Initial delay between retries in seconds
+        stream (bool): Whether to request a streamed response
+        response_format (Optional[Dict]): Optional OpenAI response format
+
+    Returns:
+        The OpenAI ChatCompletion, or a Stream of ChatCompletionChunks if stream=True
+    """
+
+    retryable_errors = (
+        RateLimitError,
+        APIConnectionError,
+        APITimeoutError,
+        InternalServerError,
+    )
+
+    # Only send response_format when set, so the default request is unchanged
+    extra_params = {}
+    if response_format is not None:
+        extra_params["response_format"] = response_format
+
+    for attempt in range(max_retries + 1):
+        try:
+            # Make API call to OpenAI
+            # Temperature is set low (0.2) for more deterministic, focused responses
+            return completion_client.chat.completions.create(
+                model=OPENAI_MODEL,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                max_tokens=max_tokens,
+                temperature=0.2,  # Low temperature for consistent, focused output
+                stream=stream,
+                **extra_params,
+            )
+
+        except retryable_errors as e:
+            if attempt < max_retries:
+                delay = _backoff_delay(e, attempt, retry_delay)
+                logger.warning(
+                    " LLM API call failed (attempt %d/%d): %s. Retrying in %.1fs...",
+                    attempt + 1,
+                    max_retries + 1,
+                    type(e).__name__,
+                    delay,
+                )
+                time.sleep(delay)
+            else:
+                # Final attempt failed
+                logger.error(
+                    " LLM API call failed after %d attempts: %s",
+                    max_retries + 1,
+                    type(e).__name__,
+                )
+                raise
+        except Exception as e:
+            # Non-retryable errors (e.g., authentication, invalid request) fail immediately
+            logger.error(
+                " LLM API call failed with non-retryable error: %s: %s",
+                type(e).__name__,
+                e,
+            )
+            raise
+
+
+def _backoff_delay(error: Exception, attempt: int, retry_delay: float) -> float:
+    """
+    Compute how long to wait before retrying a failed LLM API call.
+
+    Uses exponential backoff (the delay doubles with each retry, capped at
+    MAX_RETRY_DELAY) with random jitter, so that concurrent callers hitting
+    the same rate limit don't all retry at the same instant. If the API sent
+    a Retry-After header, that value is honored instead, parsed the same way
+    as for the scrapers (see rate_limiter.retry_after_delay).
+
+    Args:
+        error (Exception): The retryable error raised by the OpenAI client
+        attempt (int): The zero-based number of the failed attempt
+        retry_delay (float): Initial delay between retries in seconds
+
+    Returns:
+        float: The delay in seconds
+    """
+
+    delay = min(MAX_RETRY_DELAY, retry_delay * (2**attempt))
+    return retry_after_delay(
+        getattr(error, "response", None), delay * (0.5 + random.random())
+    )
+
+
+def _iter_stream(response) -> Iterator[str]:
+    """
+    Yield text content from a streamed chat completion.
+
+    Closing the generator (explicitly or via garbage collection) closes the
+    underlying HTTP stream, which cancels generation on the OpenAI side.
+
+    Args:
+        response: The OpenAI Stream of ChatCompletionChunks
+
+    Yields:
+        str: Non-empty content deltas in arrival order
+    """
+
+    try:
+        for chunk in response:
+            if not chunk.choices:
+                continue
+            content = chunk.choices[0].delta.content
+            if content:
+                yield content
+    finally:
+        response.close()
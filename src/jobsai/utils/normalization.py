@@ -16,10 +16,33 @@ Functions:
 """
 
 import re
+from functools import lru_cache
 from typing import List, Dict, Any
 
 from jobsai.config.schemas import SKILL_ALIAS_MAP
 
+# Regexes used by normalize_text, compiled once at import
+# Matches trailing whitespace (other than the line break itself) at the end of each line
+_TRAILING_WS_RE = re.compile(r"[^\S\n]+$", re.MULTILINE)
+# Matches runs of three or more line breaks (i.e. more than one blank line)
+# Blank lines are already empty once trailing whitespace has been removed
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+# Skill profile keys whose values are lists of skills/items
+_LIST_KEYS = (
+    "core_languages",
+    "frameworks_and_libraries",
+    "tools_and_platforms",
+    "agentic_ai_experience",
+    "ai_ml_experience",
+    "soft_skills",
+    "projects_mentioned",
+    "job_search_keywords",
+)
+
+# Default experience levels (read-only: used directly as a fallback, never mutated)
+_DEFAULT_EXPERIENCE_LEVELS = {"Python": 0, "JavaScript": 0, "Agentic AI": 0, "AI/ML": 0}
+
 # ------------------------------
 # Public interfaces
 # ------------------------------
@@ -36,56 +59,25 @@ def normalize_parsed(profile_dict: Dict[str, Any]) -> Dict[str, Any]:
         Dict[str, Any]: The normalized parsed skills JSON
     """
 
-    keys = [
-        "name",
-        "core_languages",
-        "frameworks_and_libraries",
-        "tools_and_platforms",
-        "agentic_ai_experience",
-        "ai_ml_experience",
-        "soft_skills",
-        "projects_mentioned",
-        "experience_level",
-        "job_search_keywords",
-    ]
-    # Ensure all keys exist in the JSON the LLM generated
-    for field_name in keys:
-        if field_name not in profile_dict:
-            profile_dict[field_name] = (
-                []
-                if field_name != "experience_level"
-                else {"Python": 0, "JavaScript": 0, "Agentic AI": 0, "AI/ML": 0}
-            )
-
-    # Normalize lists
-    for list_key in [
-        "core_languages",
-        "frameworks_and_libraries",
-        "tools_and_platforms",
-        "agentic_ai_experience",
-        "ai_ml_experience",
-        "soft_skills",
-        "projects_mentioned",
-        "job_search_keywords",
-    ]:
-        if isinstance(profile_dict.get(list_key), list):
-            profile_dict[list_key] = normalize_list(profile_dict[list_key])
-        else:
-            profile_dict[list_key] = []
+    # Every key of the profile is set unconditionally below, so keys missing
+    # from the JSON the LLM generated get their defaults in the same pass
+
+    # Normalize lists (missing or non-list values become empty lists)
+    for list_key in _LIST_KEYS:
+        value = profile_dict.get(list_key)
+        profile_dict[list_key] = (
+            normalize_list(value) if isinstance(value, list) else []
+        )
 
     # Normalize experience_level keys and values
-    experience_levels = profile_dict.get("experience_level", {})
+    experience_levels = profile_dict.get(
+        "experience_level", _DEFAULT_EXPERIENCE_LEVELS
+    )
     normalized_experience_levels = {
-        "Python": int(experience_levels.get("Python") or 0),
-        "JavaScript": int(experience_levels.get("JavaScript") or 0),
-        "Agentic AI": int(
-            experience_levels.get("Agentic AI")
-            or experience_levels.get("Agentic_Ai")
-            or 0
-        ),
-        "AI/ML": int(
-            experience_levels.get("AI/ML") or experience_levels.get("AI_ML") or 0
-        ),
+        "Python": _coerce_int(experience_levels, "Python"),
+        "JavaScript": _coerce_int(experience_levels, "JavaScript"),
+        "Agentic AI": _coerce_int(experience_levels, "Agentic AI", "Agentic_Ai"),
+        "AI/ML": _coerce_int(experience_levels, "AI/ML", "AI_ML"),
     }
     profile_dict["experience_level"] = normalized_experience_levels
 
@@ -97,29 +89,25 @@ def normalize_parsed(profile_dict: Dict[str, Any]) -> Dict[str, Any]:
     return profile_dict
 
 
-def normalize_list(skill_items: List[str]) -> List[str]:
+def normalize_list(skill_items: List[str], *, all_strings: bool = False) -> List[str]:
     """
     Normalize list of skill items by deduplicating and standardizing capitalization.
 
     Args:
         skill_items: List of skill/item strings to normalize
+        all_strings: If True, the caller guarantees every item is a string and the
+            per-item type check is skipped. Non-string items are otherwise dropped.
 
     Returns:
         List[str]: Normalized list with duplicates removed and proper capitalization
     """
 
-    normalized = []
-    seen = set()
+    if not all_strings:
+        skill_items = [item for item in skill_items if isinstance(item, str)]
 
-    for item in skill_items:
-        if not isinstance(item, str):
-            continue
-        normalized_value = _normalize_token(item)
-        if normalized_value and normalized_value not in seen:
-            normalized.append(normalized_value)
-            seen.add(normalized_value)
-
-    return normalized
+    # Normalize each item, drop empty results and deduplicate preserving order
+    # (dict.fromkeys keeps the first occurrence of each key, all in C)
+    return list(dict.fromkeys(filter(None, map(_normalize_token, skill_items))))
 
 
 def normalize_text(text: str) -> str:
@@ -139,13 +127,16 @@ def normalize_text(text: str) -> str:
         return text
 
     # Convert CRLF → LF
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    # (LLM output rarely has carriage returns, so one scan usually skips both replaces)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
 
     # Remove trailing spaces from lines
-    text = "\n".join(line.rstrip() for line in text.split("\n"))
+    # A single regex pass instead of splitting into a list of lines and joining back
+    text = _TRAILING_WS_RE.sub("", text)
 
     # Collapse multiple blank lines → one
-    text = re.sub(r"\n\s*\n\s*\n+", "\n\n", text)
+    text = _BLANK_LINES_RE.sub("\n\n", text)
 
     # Remove leading/trailing blank lines
     text = text.strip()
@@ -154,12 +145,35 @@ def normalize_text(text: str) -> str:
 
 
 # ------------------------------
-# Internal function
+# Internal functions
 # ------------------------------
+def _coerce_int(values: Dict[str, Any], *keys: str) -> int:
+    """
+    Return the first truthy value found under any of the keys, as an integer.
+
+    Args:
+        values (Dict[str, Any]): Dictionary to look the keys up in
+        *keys (str): Candidate keys (e.g. a canonical key and its aliases), in priority order
+
+    Returns:
+        int: The integer value (numeric strings are converted), or 0 if none of the keys has a value
+    """
+
+    for key in keys:
+        value = values.get(key)
+        if value:
+            return int(value)
+    return 0
+
+
+@lru_cache(maxsize=4096)
 def _normalize_token(token: str) -> str:
     """
     Normalize token
 
+    Memoized: the function is pure (SKILL_ALIAS_MAP is never modified at
+    runtime) and the same skill names recur across lists and profiles.
+
     Args:
         token (str): The token string to normalize
 
@@ -171,9 +185,11 @@ def _normalize_token(token: str) -> str:
     if not token:
         return token
     token_lowercase = token.lower()
-    if token_lowercase in SKILL_ALIAS_MAP:
-        return SKILL_ALIAS_MAP[token_lowercase]
+    alias = SKILL_ALIAS_MAP.get(token_lowercase)
+    if alias is not None:
+        return alias
     # Basic capitalization rules
-    if token_lowercase.isupper():
-        return token
-    return token if any(c.isupper() for c in token) else token.capitalize()
+    # Keep tokens that already contain uppercase letters as is (e.g. "AWS", "TypeScript"),
+    # capitalize all-lowercase tokens. Comparing against the lowercased token detects
+    # uppercase letters without scanning the characters in Python.
+    return token if token != token_lowercase else token.capitalize()
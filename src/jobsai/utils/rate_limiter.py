@@ -0,0 +1,132 @@
+"""
+Adaptive Rate Limiting for Job Board Scrapers.
+
+This module provides a thread-safe token bucket rate limiter. The scrapers fetch
+search and job detail pages concurrently, so instead of fixed sleeps between
+requests, each request takes a token from the job board's bucket. Tokens refill
+at a steady rate, which allows short bursts (e.g. a page of job details) while
+keeping the average request rate polite.
+
+The rate adapts to the server: it is halved whenever the server responds with
+429 (too many requests) or 503 (service unavailable), and recovers gradually
+while requests succeed. When the server says how long to wait (a Retry-After
+header on the 429/503 response), that delay is used for the retry. Otherwise
+retries back off exponentially with random jitter, so that concurrent workers
+retrying the same failure don't all hit the server at the same instant.
+
+Classes:
+    TokenBucket: Thread-safe, adaptive token bucket rate limiter
+
+Functions:
+    backoff_delay: Compute a jittered exponential backoff delay
+    retry_after_delay: Compute the wait before retrying a throttled request
+"""
+
+import time
+import random
+import threading
+from typing import Optional
+
+import requests
+
+# Upper bound (in seconds) for a server-requested Retry-After delay, so that a
+# single throttled request can't stall the whole search
+MAX_RETRY_AFTER = 30.0
+
+# Upper bound (in seconds) for an exponential backoff delay (before jitter)
+MAX_BACKOFF = 30.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter with adaptive rate.
+
+    Args:
+        rate (float): Tokens (requests) added per second. This is also the
+            maximum rate the bucket recovers to after being slowed down.
+        burst (int): Maximum number of tokens in the bucket, i.e. how many
+            requests can be made back to back after an idle period.
+        min_rate (float): Lower bound for the rate when slowing down.
+    """
+
+    def __init__(self, rate: float = 2.0, burst: int = 4, min_rate: float = 0.25):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    # ------------------------------
+    # Public interface
+    # ------------------------------
+    def acquire(self) -> None:
+        """Take a token, waiting until one is available.
+
+        The token is reserved under the lock and the wait happens outside it,
+        so concurrent callers queue up one refill interval apart.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._last) * self.rate
+            )
+            self._last = now
+            self._tokens -= 1
+            # A negative balance is the time (in tokens) this caller must wait
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if delay:
+            time.sleep(delay)
+
+    def slow_down(self) -> None:
+        """Halve the rate (down to min_rate), e.g. after a 429 or 503 response."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+
+    def speed_up(self) -> None:
+        """Recover the rate gradually (up to the initial rate) after a success."""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate * 1.25)
+
+
+def backoff_delay(backoff: float, attempt: int) -> float:
+    """Compute a jittered exponential backoff delay before retrying a request.
+
+    The delay doubles with each failed attempt (capped at MAX_BACKOFF) and is
+    randomized between half and one and a half times that.
+
+    Args:
+        backoff: Delay in seconds after the first failed attempt (before jitter).
+        attempt: The one-based number of the failed attempt.
+
+    Returns:
+        float: The delay in seconds
+    """
+    delay = min(MAX_BACKOFF, backoff * 2 ** (attempt - 1))
+    return delay * (0.5 + random.random())
+
+
+def retry_after_delay(response: Optional[requests.Response], default: float) -> float:
+    """Compute how long to wait before retrying a 429 or 503 response.
+
+    Args:
+        response: The throttled response (None if the request failed outright).
+            Any response with a case-insensitive headers mapping works, e.g.
+            the httpx response attached to an OpenAI API error.
+        default: Backoff delay in seconds, used when the server didn't send a
+            Retry-After header in seconds.
+
+    Returns:
+        float: The delay in seconds (server-requested delays are capped at
+            MAX_RETRY_AFTER)
+    """
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after:
+        try:
+            return min(MAX_RETRY_AFTER, max(0.0, float(retry_after)))
+        except ValueError:
+            # Retry-After may also be an HTTP date; fall back to backoff
+            pass
+    return default
@@ -2,13 +2,18 @@
 Functions for scraping the Duunitori job board.
 
     scrape_duunitori
-    _fetch_page                 (internal use only)
-    _parse_job_card             (internal use only)
-    _fetch_full_job_description (internal use only)
+    iter_duunitori
+    _fetch_page                  (internal use only)
+    _fetch_search_page           (internal use only)
+    _parse_job_card              (internal use only)
+    _fetch_full_job_descriptions (internal use only)
+    _fetch_full_job_description  (internal use only)
+    _read_until_description      (internal use only)
 
 DESCRIPTION:
     1. When given a query, fetches the job detail page and extracts the full description for each listing (deep mode)
     2. Returns a list of normalized job dicts (doesn't persist to disk)
+       (iter_duunitori yields them page by page instead)
 
 URL SCHEME:
     Template:         https://duunitori.fi/tyopaikat/haku/{query_slug}?sivu={page}
@@ -32,13 +37,18 @@ import time
 import logging
 import requests
 import re
-from typing import List, Dict, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Callable, Iterator
 from urllib.parse import urljoin, quote_plus
 
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
+from requests.adapters import HTTPAdapter
 
 from jobsai.config.headers import HEADERS_DUUNITORI
 from jobsai.utils.exceptions import CancellationError
+from jobsai.utils.rate_limiter import TokenBucket, backoff_delay, retry_after_delay
 from jobsai.config.paths import (
     HOST_URL_DUUNITORI,
     SEARCH_URL_BASE_DUUNITORI,
@@ -46,6 +56,66 @@ from jobsai.config.paths import (
 
 logger = logging.getLogger(__name__)
 
+# Number of job detail pages fetched concurrently in deep mode
+# Kept within the session's connection pool size and low enough not to hammer the website
+DETAIL_FETCH_WORKERS = 8
+
+# Size (in bytes) of the chunks in which job detail pages are downloaded
+DETAIL_CHUNK_SIZE = 16 * 1024
+
+# Rate limiter shared by all requests to Duunitori (search and job detail pages)
+# Allows short bursts (a page of job details) at a polite average rate, and slows
+# down when Duunitori responds with 429/503
+_RATE_LIMITER = TokenBucket(rate=4.0, burst=DETAIL_FETCH_WORKERS)
+
+# Number of pooled (kept-alive) connections per host in the module-level session
+HTTP_POOL_SIZE = 20
+
+# Module-level HTTP session, used when the caller doesn't pass a session
+# Keeps the TCP/TLS connections to Duunitori alive across scrape_duunitori calls
+# (retries are handled by _fetch_page, so the adapter doesn't retry on its own)
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS_DUUNITORI)
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE),
+)
+
+# Matches hrefs that need urljoin to be resolved: anything but a plain root-relative
+# path (protocol-relative URLs, dot segments, queries, fragments and the whitespace
+# urljoin strips). Plain paths are simply appended to the host
+_URLJOIN_NEEDED_RE = re.compile(r"^//|/\.|[?#\t\r\n]")
+
+# Only the search result containers are parsed from search pages
+# Everything else on the page (navigation, ads, footer, ...) is skipped by the parser
+# The class is matched with a regex because the strainer sees the raw
+# (space-separated) class attribute value during parsing
+_SEARCH_RESULTS_STRAINER = SoupStrainer(
+    class_=re.compile(r"(?:^|\s)grid-sandbox--tight-top(?:\s|$)")
+)
+
+# Only the description elements (and their contents) are parsed from job detail pages
+_DESCRIPTION_STRAINER = SoupStrainer(
+    class_=re.compile(r"(?:^|\s)description(?:--jobentry)?(?:\s|$)")
+)
+
+# Search page job card and job detail page description selectors, compiled once
+# instead of on every page
+# (soupsieve is the CSS selector engine behind BeautifulSoup's select/select_one)
+_JOB_CARD_SELECTOR = soupsieve.compile(
+    ".grid-sandbox.grid-sandbox--tight-bottom.grid-sandbox--tight-top "
+    ".grid.grid--middle.job-box.job-box--lg"
+)
+_DESCRIPTION_SELECTOR = soupsieve.compile(".description, .description--jobentry")
+
+# Class of the job cards (see _JOB_CARD_SELECTOR), probed for in a search page's
+# raw bytes before parsing it
+_JOB_CARD_MARKER = b"job-box--lg"
+
+# Classes of the description elements, used to stop downloading a job detail page
+# once its description has been received (see _read_until_description)
+_DESCRIPTION_CLASSES = frozenset(("description", "description--jobentry"))
+
 
 # ------------------------------
 # Public interface
@@ -57,136 +127,208 @@ def scrape_duunitori(
     session: Optional[requests.Session] = None,
     per_page_limit: Optional[int] = None,
     cancellation_check: Optional[Callable[[], bool]] = None,
+    detail_cache: Optional[Dict[str, str]] = None,
 ) -> List[Dict]:
     """
     Fetch job listings from Duunitori.
 
+    Collects the jobs yielded by iter_duunitori into a list (see iter_duunitori
+    for the arguments).
+
+    Returns:
+        List[Dict]: The list of normalized job dictionaries.
+
+    Raises:
+        CancellationError: If cancellation_check returns True during execution
+    """
+
+    return list(
+        iter_duunitori(
+            query,
+            num_pages=num_pages,
+            deep_mode=deep_mode,
+            session=session,
+            per_page_limit=per_page_limit,
+            cancellation_check=cancellation_check,
+            detail_cache=detail_cache,
+        )
+    )
+
+
+def iter_duunitori(
+    query: str,
+    num_pages: int = 10,
+    deep_mode: bool = True,
+    session: Optional[requests.Session] = None,
+    per_page_limit: Optional[int] = None,
+    cancellation_check: Optional[Callable[[], bool]] = None,
+    detail_cache: Optional[Dict[str, str]] = None,
+) -> Iterator[Dict]:
+    """
+    Yield job listings from Duunitori, one search page at a time.
+
+    Jobs are yielded as soon as their page (and, in deep mode, the page's job
+    details) has been fetched, so consumers can process them incrementally.
+
     Args:
         query: The search query string, e.g. "python developer".
         num_pages: The number of pages to crawl.
         deep_mode: If True, fetch each job's detail page to extract the full description.
-        session: The requests.Session to reuse connections (recommended).
+        session: The requests.Session to reuse connections. Defaults to a
+            module-level session shared between calls.
         per_page_limit: The optional cap on total listings (stops when reached).
         cancellation_check: Optional callable that returns True if the operation
             should be cancelled. Checked before each page fetch and before each
             job detail fetch in deep mode.
+        detail_cache: Optional dictionary of job URL -> full description, shared
+            between calls so that a job found by several queries is fetched only
+            once in deep mode. Fetched descriptions are added to it.
 
-    Returns:
-        List[Dict]: The list of normalized job dictionaries.
+    Yields:
+        Dict: The normalized job dictionaries.
 
     Raises:
         CancellationError: If cancellation_check returns True during execution
     """
 
     if session is None:
-        # Create HTTP session
-        session = requests.Session()
-    # Update default headers
-    session.headers.update(HEADERS_DUUNITORI)
+        # Reuse the module-level HTTP session (and its pooled connections)
+        session = _SESSION
+    else:
+        # Update default headers
+        session.headers.update(HEADERS_DUUNITORI)
 
     # Slugify query (URL-compliant)
-    # Replace whitespace with hyphens and remove unsafe chars
-    slugified_query = re.sub(r"\s+", "-", query.strip().lower())
+    # Replace whitespace runs with hyphens (split() also drops leading/trailing whitespace)
+    slugified_query = "-".join(query.lower().split())
     # URL-encode the slugified query
     query_slug = quote_plus(slugified_query, safe="-")
 
-    results = []
+    # URLs of the jobs found so far (the same job may be listed on several pages)
+    seen_urls = set()
     # Total number of fetched jobs
     total_fetched = 0
 
-    # Iterate over a number of webpages (10 by default)
-    for page in range(1, num_pages + 1):
-        # Check for cancellation before fetching each page
-        if cancellation_check and cancellation_check():
-            logger.info(" Duunitori scraping cancelled by user")
-            raise CancellationError("Pipeline cancelled during job search")
-
-        # Build search URL with slugified query and page number
-        search_url = SEARCH_URL_BASE_DUUNITORI.format(query_slug=query_slug, page=page)
-
-        logger.info(" Fetching Duunitori search page: %s", search_url)
+    # The next search page is prefetched in the background while the job details
+    # of the current page are being fetched (see below)
+    next_page = None
 
-        # Get response safely
-        response = _fetch_page(session, search_url)
+    with ThreadPoolExecutor(max_workers=1) as prefetcher:
+        # Iterate over a number of webpages (10 by default)
+        for page in range(1, num_pages + 1):
+            # Check for cancellation before fetching each page
+            if cancellation_check and cancellation_check():
+                logger.info(" Duunitori scraping cancelled by user")
+                raise CancellationError("Pipeline cancelled during job search")
 
-        if not response:
-            logger.warning(" Failed to fetch search page %s — stopping", search_url)
-            break
-        if response.status_code != 200:
-            logger.warning(
-                " Non-200 status (%s) for %s — stopping",
-                response.status_code,
-                search_url,
+            # Build search URL with slugified query and page number
+            search_url = SEARCH_URL_BASE_DUUNITORI.format(
+                query_slug=query_slug, page=page
             )
-            break
 
-        # Parse the HTML text with a HTML parser
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        # Select all job cards on current page (ignore cards in 'Duunitori suosittelee' section)
-        job_cards = soup.select(
-            ".grid-sandbox.grid-sandbox--tight-bottom.grid-sandbox--tight-top .grid.grid--middle.job-box.job-box--lg"
-        )
+            # Get response from the search URL (prefetched, if available)
+            if next_page is not None:
+                response = next_page.result()
+                next_page = None
+            else:
+                response = _fetch_search_page(session, search_url)
 
-        # Break if less than 20 job cards on page (there's no next page)
-        if len(job_cards) < 20:
-            break
+            if not response:
+                logger.warning(" Failed to fetch search page %s — stopping", search_url)
+                break
+            if response.status_code != 200:
+                logger.warning(
+                    " Non-200 status (%s) for %s — stopping",
+                    response.status_code,
+                    search_url,
+                )
+                break
+
+            # A page without the job card class anywhere in its bytes has no job cards,
+            # so it isn't parsed at all (e.g. the empty page after the last results)
+            if _JOB_CARD_MARKER in response.content:
+                # Parse the search result containers with lxml (a C extension)
+                # The raw bytes are handed to lxml, which decodes them while parsing
+                soup = BeautifulSoup(
+                    response.content,
+                    "lxml",
+                    from_encoding=response.encoding,
+                    parse_only=_SEARCH_RESULTS_STRAINER,
+                )
 
-        # Break if no results on current page
-        if not job_cards:
-            logger.info(
-                " No job cards found on page %s for query '%s' — stopping pagination",
-                page,
-                query,
-            )
-            break
+                # Select all job cards on current page (ignore cards in 'Duunitori suosittelee' section)
+                job_cards = _JOB_CARD_SELECTOR.select(soup)
+            else:
+                job_cards = []
+
+            # Break if no results on current page
+            if not job_cards:
+                logger.info(
+                    " No job cards found on page %s for query '%s' — stopping pagination",
+                    page,
+                    query,
+                )
+                break
 
-        # Iterate over job cards on current page
-        for job_card in job_cards:
-            # Check for cancellation before processing each job (especially important in deep mode)
+            # Check for cancellation before processing the job cards
             if cancellation_check and cancellation_check():
                 logger.info(" Duunitori scraping cancelled by user")
                 raise CancellationError("Pipeline cancelled during job search")
 
-            job = _parse_job_card(job_card)
-
-            # If in deep mode, and we have a URL, fetch the full job description
-            if deep_mode and job.get("url"):
-                try:
-                    # Fetch the full job description
-                    detail = _fetch_full_job_description(session, job["url"])
-
-                    if detail:
-                        job["full_description"] = detail
-                except Exception as e:
-                    logger.warning(
-                        " Error fetching detail for %s: %s", job.get("url"), e
-                    )
-                    job["full_description"] = ""
-            else:
+            # Parse the job cards on current page
+            jobs = []
+            for job_card in job_cards:
+                job = _parse_job_card(job_card)
+                # Skip jobs already found on previous pages (or earlier on this page)
+                url = job["url"]
+                if url:
+                    if url in seen_urls:
+                        continue
+                    seen_urls.add(url)
                 job["full_description"] = ""
+                # Add metadata
+                job["query_used"] = query
+                jobs.append(job)
+
+            # Only keep as many jobs as fit under per_page_limit
+            if per_page_limit:
+                jobs = jobs[: per_page_limit - total_fetched]
+
+            # Prefetch the next search page while this page's job details are fetched
+            # Only when there is a next page (a full page of cards) that will be used
+            if (
+                page < num_pages
+                and len(job_cards) >= 20
+                and not (per_page_limit and total_fetched + len(jobs) >= per_page_limit)
+            ):
+                next_page = prefetcher.submit(
+                    _fetch_search_page,
+                    session,
+                    SEARCH_URL_BASE_DUUNITORI.format(
+                        query_slug=query_slug, page=page + 1
+                    ),
+                )
+
+            # If in deep mode, fetch the full job descriptions concurrently
+            if deep_mode:
+                _fetch_full_job_descriptions(
+                    session, jobs, cancellation_check, detail_cache
+                )
 
-            # Add metadata
-            job["query_used"] = query
-            results.append(job)
-            total_fetched += 1
+            yield from jobs
+            total_fetched += len(jobs)
 
             # Break if reached per_page_limit
             if per_page_limit and total_fetched >= per_page_limit:
                 logger.info(" Reached per_page_limit (%s). Stopping.", per_page_limit)
-                return results
+                return
 
-        # Add delay to avoid hammering the website
-        time.sleep(0.8)
+            # Break if less than 20 job cards on page
+            # (there's no next page)
+            if len(job_cards) < 20:
+                break
 
-        # Break if less than 20 job cards on page
-        # (there's no next page)
-        if len(job_cards) < 20:
-            break
-
-    logger.info(" Fetched %s listings for query '%s'", len(results), query)
-
-    return results
+    logger.info(" Fetched %s listings for query '%s'", total_fetched, query)
 
 
 # ------------------------------
@@ -200,16 +342,21 @@ def _fetch_page(
     retries: int = 3,
     backoff: float = 1.0,
     timeout: float = 10.0,
+    stream: bool = False,
 ) -> Optional[requests.Response]:
     """
     Fetch a page with retry logic and error handling.
 
+    Every request (including retries) first takes a token from the rate limiter.
+
     Args:
         session: current HTTP session
         url: search URL
         retries: number of search retries
-        backoff: backoff multiplier for retries
+        backoff: delay (in seconds) before the first retry, doubled for each later one
         timeout: time to timeout
+        stream: if True, the response body is not downloaded up front (the caller
+            reads it with iter_content and must close the response)
 
     Returns:
         Optional[requests.Response]: Response object if successful, None if all retries failed
@@ -218,19 +365,26 @@ def _fetch_page(
     # Iterate 3 times (by default)
     for attempt in range(1, retries + 1):
         try:
-            # Get response
-            response = session.get(url, timeout=timeout)
+            # Wait for the rate limiter, then get response
+            _RATE_LIMITER.acquire()
+            response = session.get(url, timeout=timeout, stream=stream)
             # If OK, return response
             if response.status_code == 200:
+                _RATE_LIMITER.speed_up()
                 return response
-            # If 'too many requests' or 'unavailable', wait a bit and continue
+            # If 'too many requests' or 'unavailable', slow down, wait and continue
             elif response.status_code in (429, 503):
                 logger.warning(
                     " Rate-limited or service unavailable (status %s) for %s. Backing off",
                     response.status_code,
                     url,
                 )
-                time.sleep(backoff * attempt)
+                _RATE_LIMITER.slow_down()
+                response.close()
+                if attempt < retries:
+                    time.sleep(
+                        retry_after_delay(response, backoff_delay(backoff, attempt))
+                    )
             # If error, return response
             else:
                 logger.debug(" Non-200 status %s for %s", response.status_code, url)
@@ -239,10 +393,30 @@ def _fetch_page(
             logger.warning(
                 " Request failed (attempt %s/%s) for %s: %s", attempt, retries, url, e
             )
-            time.sleep(backoff * attempt)
+            if attempt < retries:
+                time.sleep(backoff_delay(backoff, attempt))
     return None
 
 
+def _fetch_search_page(
+    session: requests.Session, url: str
+) -> Optional[requests.Response]:
+    """
+    Fetch a search page (logged, so it can also run on the prefetch thread).
+
+    Args:
+        session: current HTTP session
+        url: search URL
+
+    Returns:
+        Optional[requests.Response]: Response object if successful, None if all retries failed
+    """
+
+    logger.info(" Fetching Duunitori search page: %s", url)
+
+    return _fetch_page(session, url)
+
+
 def _parse_job_card(job_card: BeautifulSoup) -> Dict:
     """
     Parse a search-result job card into a partial job dictionary.
@@ -256,57 +430,113 @@ def _parse_job_card(job_card: BeautifulSoup) -> Dict:
         Dict: The dictionary with job information.
     """
 
-    # Parse title from job card
-    title_tag = job_card.select_one(".job-box__title")
+    # Find the tags of all fields in a single walk over the card
+    # Each field takes the first matching tag in document order, like select_one would,
+    # without running a CSS selector (and re-walking the card) per field
+    title_tag = job_tag = location_tag = published_tag = None
+    for tag in job_card.find_all(True):
+        classes = tag.get("class")
+        if not classes:
+            continue
+        if title_tag is None and "job-box__title" in classes:
+            title_tag = tag
+        if (
+            job_tag is None
+            and "job-box__hover" in classes
+            and "gtm-search-result" in classes
+        ):
+            job_tag = tag
+        if location_tag is None and "job-box__job-location" in classes:
+            location_tag = tag
+        if published_tag is None and "job-box__job-posted" in classes:
+            published_tag = tag
+
+    # Parse title from job card (.job-box__title)
     title = title_tag.get_text(strip=True) if title_tag else ""
 
-    # Parse company from job card
-    job_tag = job_card.select_one(".job-box__hover.gtm-search-result")
-    company = (
-        job_tag.get("data-company")
-        if job_tag and job_tag.has_attr("data-company")
-        else ""
-    )
+    # Parse company from job card (.job-box__hover.gtm-search-result)
+    company = job_tag.get("data-company", "") if job_tag else ""
 
-    # Parse location from job card
-    location_tag = job_card.select_one(".job-box__job-location")
-    location = (
-        location_tag.get_text(strip=True)
-        if location_tag
-        else (
-            job_card.select_one(".job-box__job-location").get_text(strip=True)
-            if job_card.select_one(".job-box__job-location")
-            else ""
-        )
-    )
+    # Parse location from job card (.job-box__job-location)
+    location = location_tag.get_text(strip=True) if location_tag else ""
 
     # Parse URL from job card
-    href = job_tag.get("href") if job_tag and job_tag.has_attr("href") else ""
-    full_url = urljoin(HOST_URL_DUUNITORI, href) if href else ""
-
-    # Parse published date from job card
-    published_tag = job_card.select_one(".job-box__job-posted")
-    published = (
-        published_tag.get_text(strip=True)
-        if published_tag
-        else (
-            job_card.select_one(".job-box__job-posted").get_text(strip=True)
-            if job_card.select_one(".job-box__job-posted")
-            else ""
-        )
-    )
+    href = job_tag.get("href", "") if job_tag else ""
+    if href[:1] == "/" and not _URLJOIN_NEEDED_RE.search(href):
+        full_url = HOST_URL_DUUNITORI + href
+    else:
+        full_url = urljoin(HOST_URL_DUUNITORI, href) if href else ""
+
+    # Parse published date from job card (.job-box__job-posted)
+    published = published_tag.get_text(strip=True) if published_tag else ""
 
     return {
         "title": title,
         "company": company,
         "location": location,
         "url": full_url,
-        "description_snippet": None,
+        "description_snippet": "",
         "published_date": published,
         "source": "duunitori",
     }
 
 
+def _fetch_full_job_descriptions(
+    session: requests.Session,
+    jobs: List[Dict],
+    cancellation_check: Optional[Callable[[], bool]] = None,
+    detail_cache: Optional[Dict[str, str]] = None,
+) -> None:
+    """
+    Fetch the full job descriptions for a page of jobs concurrently (deep mode).
+
+    The detail pages are fetched by a small thread pool sharing the session's
+    connection pool, so a page of jobs costs roughly one round of requests
+    instead of one request after another. Each URL is fetched at most once,
+    and URLs already in detail_cache are not fetched at all. The descriptions
+    are stored in the job dictionaries in place.
+
+    Args:
+        session: current HTTP session
+        jobs: job dictionaries parsed from a search page
+        cancellation_check: Optional callable that returns True if the operation
+            should be cancelled. Checked before each job detail fetch.
+        detail_cache: Optional dictionary of job URL -> full description
+
+    Raises:
+        CancellationError: If cancellation_check returns True during execution
+    """
+
+    if detail_cache is None:
+        detail_cache = {}
+
+    def fetch(url: str) -> str:
+        # Check for cancellation before each job detail fetch
+        if cancellation_check and cancellation_check():
+            logger.info(" Duunitori scraping cancelled by user")
+            raise CancellationError("Pipeline cancelled during job search")
+        try:
+            return _fetch_full_job_description(session, url)
+        except Exception as e:
+            logger.warning(" Error fetching detail for %s: %s", url, e)
+            return ""
+
+    # Unique URLs that have not been fetched before (in first-seen order)
+    urls = list(
+        dict.fromkeys(
+            job["url"]
+            for job in jobs
+            if job.get("url") and job["url"] not in detail_cache
+        )
+    )
+    with ThreadPoolExecutor(max_workers=DETAIL_FETCH_WORKERS) as executor:
+        detail_cache.update(zip(urls, executor.map(fetch, urls)))
+
+    for job in jobs:
+        if job.get("url"):
+            job["full_description"] = detail_cache[job["url"]]
+
+
 def _fetch_full_job_description(
     session: requests.Session, job_url: str, retries: int = 2
 ) -> str:
@@ -322,8 +552,8 @@ def _fetch_full_job_description(
         str: The full job description text, or an empty string if the description is not found.
     """
 
-    # Get response safely
-    response = _fetch_page(session, job_url, retries=retries)
+    # Get response safely (the body is streamed, see below)
+    response = _fetch_page(session, job_url, retries=retries, stream=True)
 
     if not response or response.status_code != 200:
         logger.debug(
@@ -331,13 +561,62 @@ def _fetch_full_job_description(
             job_url,
             getattr(response, "status_code", None),
         )
+        if response is not None:
+            response.close()
         return ""
 
-    # Parse the HTML text with a HTML parser
-    soup = BeautifulSoup(response.text, "html.parser")
+    try:
+        # Download the page only until the description element has been received
+        # (the rest of the page is never downloaded or parsed)
+        content = _read_until_description(response.iter_content(DETAIL_CHUNK_SIZE))
+    finally:
+        response.close()
+
+    # Parse only the description elements with the lxml parser (from the raw bytes)
+    soup = BeautifulSoup(
+        content,
+        "lxml",
+        from_encoding=response.encoding,
+        parse_only=_DESCRIPTION_STRAINER,
+    )
 
     # Find the full job description
-    description_tag = soup.select_one(".description, .description--jobentry")
-    description = description_tag.get_text(strip=True) if description_tag else ""
-    if description:
-        return description
+    description_tag = _DESCRIPTION_SELECTOR.select_one(soup)
+    return description_tag.get_text(strip=True) if description_tag else ""
+
+
+def _read_until_description(chunks: Iterator[bytes]) -> bytes:
+    """
+    Read a job detail page from chunks until the first description element has ended.
+
+    The chunks are fed to an incremental lxml parser, which reports elements as soon
+    as they start and end. Reading stops at the end of the first element (in document
+    order) with a description class, the same element select_one finds.
+
+    Args:
+        chunks (Iterator[bytes]): The page content in chunks
+
+    Returns:
+        bytes: The content read (the whole page if no description element was found)
+    """
+
+    parser = etree.HTMLPullParser(events=("start", "end"))
+    content = []
+    description_element = None
+
+    for chunk in chunks:
+        content.append(chunk)
+        parser.feed(chunk)
+        for event, element in parser.read_events():
+            if event == "start":
+                classes = element.get("class")
+                if (
+                    description_element is None
+                    and classes
+                    and not _DESCRIPTION_CLASSES.isdisjoint(classes.split())
+                ):
+                    description_element = element
+            elif element is description_element:
+                return b"".join(content)
+
+    return b"".join(content)
@@ -2,14 +2,21 @@
 Functions for scraping the Jobly job board.
 
     scrape_jobly
-    _fetch_page                 (internal use only)
-    _parse_job_card             (internal use only)
-    _fetch_full_job_description (internal use only)
+    iter_jobly
+    _fetch_search_page           (internal use only)
+    _fetch_page                  (internal use only)
+    _parse_job_card              (internal use only)
+    _fetch_full_job_descriptions (internal use only)
+    _fetch_full_job_description  (internal use only)
+    _read_until_description      (internal use only)
+    _is_description_element      (internal use only)
+    _iter_outermost_blocks       (internal use only)
 
 DESCRIPTION:
     1. When given a query, fetches the job detail page and extracts the full description for each listing (deep mode)
     2. Pagination limit default is 10 pages
     3. Returns a list of normalized job dicts (doesn't persist to disk)
+       (iter_jobly yields them page by page instead)
 
 URL SCHEME:
     Template:         https://www.jobly.fi/en/jobs?search=<QUERY>&page=<PAGE>
@@ -33,13 +40,18 @@ import time
 import logging
 import requests
 import re
-from typing import List, Dict, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Callable, Iterator, Tuple
 from urllib.parse import urljoin, quote_plus
 
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from lxml import etree
+from requests.adapters import HTTPAdapter
 
 from jobsai.config.headers import HEADERS_JOBLY
 from jobsai.utils.exceptions import CancellationError
+from jobsai.utils.rate_limiter import TokenBucket, backoff_delay, retry_after_delay
 from jobsai.config.paths import (
     HOST_URL_JOBLY,
     SEARCH_URL_BASE_JOBLY,
@@ -47,6 +59,77 @@ from jobsai.config.paths import (
 
 logger = logging.getLogger(__name__)
 
+# Job card fields, as classes and attributes that identify them
+# All fields are found in a single walk over each card (see _parse_job_card),
+# matching these CSS selectors:
+#   Title:          .node__title
+#   Company:        .company-name, .company, [data-company], .employer
+#   Location:       .location, .job-location, [data-location], .city, .region
+#   URL:            a[href*='/jobs/'], a[href*='/job/']
+#   Published date: .date, .published, .posted, [data-date], .job-date, time
+#   Snippet:        .description, .snippet, .summary, .job-description
+_TITLE_CLASS = "node__title"
+_COMPANY_CLASSES = frozenset(("company-name", "company", "employer"))
+_LOCATION_CLASSES = frozenset(("location", "job-location", "city", "region"))
+_PUBLISHED_CLASSES = frozenset(("date", "published", "posted", "job-date"))
+_SNIPPET_CLASSES = frozenset(("description", "snippet", "summary", "job-description"))
+
+# Job detail page description selector, compiled once instead of on every page
+# (soupsieve is the CSS selector engine behind BeautifulSoup's select/select_one)
+_DESCRIPTION_SELECTOR = soupsieve.compile(
+    ".job-description, .description, .job-details, .content, .job-content, "
+    "main article, [role='article']"
+)
+# The classes in _DESCRIPTION_SELECTOR, for matching elements while a page is
+# being downloaded (see _is_description_element)
+_DESCRIPTION_CLASSES = frozenset(
+    ("job-description", "description", "job-details", "content", "job-content")
+)
+
+# Matches links to job detail pages
+_JOB_HREF_RE = re.compile(r"/jobs/|/job/")
+
+# Matches hrefs that need urljoin to be resolved: anything but a plain root-relative
+# path (protocol-relative URLs, dot segments, queries, fragments and the whitespace
+# urljoin strips). Plain paths are simply appended to the host
+_URLJOIN_NEEDED_RE = re.compile(r"^//|/\.|[?#\t\r\n]")
+
+# Only the job cards (and their contents) are parsed from search pages
+# Everything else on the page (navigation, filters, footer, ...) is skipped by the
+# parser, so no Python objects are created for it
+# The class is matched with a regex because the strainer sees the raw
+# (space-separated) class attribute value during parsing
+_JOB_CARD_STRAINER = SoupStrainer(class_=re.compile(r"(?:^|\s)job__content(?:\s|$)"))
+
+# Elements considered as text blocks by the description fallback
+_BLOCK_TAGS = frozenset(("div", "section", "article"))
+
+# Number of job detail pages fetched concurrently in deep mode
+# Kept within the session's connection pool size and low enough not to hammer
+# the website
+DETAIL_FETCH_WORKERS = 8
+
+# Size (in bytes) of the chunks in which job detail pages are downloaded
+DETAIL_CHUNK_SIZE = 16 * 1024
+
+# Rate limiter shared by all requests to Jobly (search and job detail pages)
+# Allows short bursts (a page of job details) at a polite average rate, and slows
+# down when Jobly responds with 429/503
+_RATE_LIMITER = TokenBucket(rate=4.0, burst=DETAIL_FETCH_WORKERS)
+
+# Number of pooled (kept-alive) connections per host in the module-level session
+HTTP_POOL_SIZE = 20
+
+# Module-level HTTP session, used when the caller doesn't pass a session
+# Keeps the TCP/TLS connections to Jobly alive across scrape_jobly calls
+# (retries are handled by _fetch_page, so the adapter doesn't retry on its own)
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS_JOBLY)
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE),
+)
+
 
 # ------------------------------
 # Public interface
@@ -58,125 +141,195 @@ def scrape_jobly(
     session: Optional[requests.Session] = None,
     per_page_limit: Optional[int] = None,
     cancellation_check: Optional[Callable[[], bool]] = None,
+    detail_cache: Optional[Dict[str, str]] = None,
 ) -> List[Dict]:
     """
     Fetch job listings from Jobly.
 
+    Collects the jobs yielded by iter_jobly into a list (see iter_jobly for the
+    arguments).
+
+    Returns:
+        List[Dict]: The list of normalized job dictionaries.
+
+    Raises:
+        CancellationError: If cancellation_check returns True during execution
+    """
+
+    return list(
+        iter_jobly(
+            query,
+            num_pages=num_pages,
+            deep_mode=deep_mode,
+            session=session,
+            per_page_limit=per_page_limit,
+            cancellation_check=cancellation_check,
+            detail_cache=detail_cache,
+        )
+    )
+
+
+def iter_jobly(
+    query: str,
+    num_pages: int = 10,
+    deep_mode: bool = True,
+    session: Optional[requests.Session] = None,
+    per_page_limit: Optional[int] = None,
+    cancellation_check: Optional[Callable[[], bool]] = None,
+    detail_cache: Optional[Dict[str, str]] = None,
+) -> Iterator[Dict]:
+    """
+    Yield job listings from Jobly, one search page at a time.
+
+    Jobs are yielded as soon as their page (and, in deep mode, the page's job
+    details) has been fetched, so consumers can process them incrementally.
+
     Args:
         query: The search query string, e.g. "python developer".
         num_pages: The number of pages to crawl.
         deep_mode: If True, fetch each job's detail page to extract the full description.
-        session: The requests.Session to reuse connections (recommended).
+        session: The requests.Session to reuse connections. Defaults to a
+            module-level session shared between calls.
         per_page_limit: The optional cap on total listings (stops when reached).
         cancellation_check: Optional callable that returns True if the operation
             should be cancelled. Checked before each page fetch and before each
             job detail fetch in deep mode.
+        detail_cache: Optional dictionary of job URL -> full description, shared
+            between calls so that a job found by several queries is fetched only
+            once in deep mode. Fetched descriptions are added to it.
 
-    Returns:
-        List[Dict]: The list of normalized job dictionaries.
+    Yields:
+        Dict: The normalized job dictionaries.
 
     Raises:
         CancellationError: If cancellation_check returns True during execution
     """
 
     if session is None:
-        # Create HTTP session
-        session = requests.Session()
-    # Update default headers
-    session.headers.update(HEADERS_JOBLY)
+        # Reuse the module-level HTTP session (and its pooled connections)
+        session = _SESSION
+    else:
+        # Update default headers
+        session.headers.update(HEADERS_JOBLY)
 
     # URL-encode query (handle spaces and special characters)
     query_encoded = quote_plus(query.strip())
 
-    results = []
+    # URLs of the jobs found so far (the same job may be listed on several pages)
+    seen_urls = set()
     total_fetched = 0
 
-    # Iterate over a number of webpages (10 by default)
-    for page in range(1, num_pages + 1):
-        # Check for cancellation before fetching each page
-        if cancellation_check and cancellation_check():
-            logger.info(" Jobly scraping cancelled by user")
-            raise CancellationError("Pipeline cancelled during job search")
-
-        # Build search URL with query and page number
-        search_url = SEARCH_URL_BASE_JOBLY.format(
-            query_encoded=query_encoded, page=page
-        )
+    # The next search page is prefetched in the background while the job details
+    # of the current page are being fetched (see below)
+    next_page = None
 
-        logger.info(" Fetching Jobly search page: %s", search_url)
+    with ThreadPoolExecutor(max_workers=1) as prefetcher:
+        # Iterate over a number of webpages (10 by default)
+        for page in range(1, num_pages + 1):
+            # Check for cancellation before fetching each page
+            if cancellation_check and cancellation_check():
+                logger.info(" Jobly scraping cancelled by user")
+                raise CancellationError("Pipeline cancelled during job search")
 
-        # Get response from the search URL
-        response = _fetch_page(session, search_url)
-        if not response:
-            logger.warning(" Failed to fetch search page %s — stopping", search_url)
-            break
-        if response.status_code != 200:
-            logger.warning(
-                " Non-200 status (%s) for %s — stopping",
-                response.status_code,
-                search_url,
+            # Build search URL with query and page number
+            search_url = SEARCH_URL_BASE_JOBLY.format(
+                query_encoded=query_encoded, page=page
             )
-            break
-        # Parse the HTML text with a HTML parser
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        # Select all job cards
-        job_cards = soup.select(".job__content.clearfix")
-
-        # If no results on current page
-        if not job_cards:
-            logger.info(
-                " No job cards found on page %s for query '%s' — stopping pagination",
-                page,
-                query,
+
+            # Get response from the search URL (prefetched, if available)
+            if next_page is not None:
+                response = next_page.result()
+                next_page = None
+            else:
+                response = _fetch_search_page(session, search_url)
+            if not response:
+                logger.warning(" Failed to fetch search page %s — stopping", search_url)
+                break
+            if response.status_code != 200:
+                logger.warning(
+                    " Non-200 status (%s) for %s — stopping",
+                    response.status_code,
+                    search_url,
+                )
+                break
+            # Parse only the job cards with the lxml parser (a C extension)
+            # The raw bytes are handed to lxml, which decodes them while parsing
+            soup = BeautifulSoup(
+                response.content,
+                "lxml",
+                from_encoding=response.encoding,
+                parse_only=_JOB_CARD_STRAINER,
             )
-            break
 
-        # Iterate over job cards on current page
-        for job_card in job_cards:
-            # Check for cancellation before processing each job (especially important in deep mode)
+            # Select all job cards
+            job_cards = soup.select(".job__content.clearfix")
+
+            # If no results on current page
+            if not job_cards:
+                logger.info(
+                    " No job cards found on page %s for query '%s' — stopping pagination",
+                    page,
+                    query,
+                )
+                break
+
+            # Check for cancellation before processing the job cards
             if cancellation_check and cancellation_check():
                 logger.info(" Jobly scraping cancelled by user")
                 raise CancellationError("Pipeline cancelled during job search")
 
-            job = _parse_job_card(job_card)
-
-            # If in deep mode, and we have a URL
-            if deep_mode and job.get("url"):
-                try:
-                    # Fetch full job description
-                    detail = _fetch_full_job_description(session, job["url"])
-
-                    if detail:
-                        # Save the full job description under its own key
-                        job["full_description"] = detail
-                except Exception as e:
-                    logger.warning(
-                        " Error fetching detail for %s: %s", job.get("url"), e
-                    )
-                    job["full_description"] = ""
-            else:
+            # Parse the job cards on current page
+            jobs = []
+            for job_card in job_cards:
+                job = _parse_job_card(job_card)
+                # Skip jobs already found on previous pages (or earlier on this page)
+                url = job["url"]
+                if url:
+                    if url in seen_urls:
+                        continue
+                    seen_urls.add(url)
                 job["full_description"] = ""
+                # Metadata enrichment
+                job["query_used"] = query
+                jobs.append(job)
+
+            # Only keep as many jobs as fit under per_page_limit
+            if per_page_limit:
+                jobs = jobs[: per_page_limit - total_fetched]
+
+            # Prefetch the next search page while this page's job details are fetched
+            # Only when there is a next page (a full page of cards) that will be used
+            if (
+                page < num_pages
+                and len(job_cards) >= 10
+                and not (per_page_limit and total_fetched + len(jobs) >= per_page_limit)
+            ):
+                next_page = prefetcher.submit(
+                    _fetch_search_page,
+                    session,
+                    SEARCH_URL_BASE_JOBLY.format(
+                        query_encoded=query_encoded, page=page + 1
+                    ),
+                )
+
+            # If in deep mode, fetch the full job descriptions concurrently
+            if deep_mode:
+                _fetch_full_job_descriptions(
+                    session, jobs, cancellation_check, detail_cache
+                )
 
-            # Metadata enrichment
-            job["query_used"] = query
-            results.append(job)
-            total_fetched += 1
+            yield from jobs
+            total_fetched += len(jobs)
 
             if per_page_limit and total_fetched >= per_page_limit:
                 logger.info(" Reached per_page_limit (%s). Stopping.", per_page_limit)
-                return results
-
-        # Add delay to avoid hammering the website
-        time.sleep(0.8)
-
-        # Break if less than expected job cards on page (likely no next page)
-        if len(job_cards) < 10:
-            break
+                return
 
-    logger.info(" Fetched %s listings for query '%s'", len(results), query)
+            # Break if less than expected job cards on page (likely no next page)
+            if len(job_cards) < 10:
+                break
 
-    return results
+    logger.info(" Fetched %s listings for query '%s'", total_fetched, query)
 
 
 # ------------------------------
@@ -190,16 +343,21 @@ def _fetch_page(
     retries: int = 3,
     backoff: float = 1.0,
     timeout: float = 10.0,
+    stream: bool = False,
 ) -> Optional[requests.Response]:
     """
     Fetch a page with retry logic and error handling.
 
+    Every request (including retries) first takes a token from the rate limiter.
+
     Args:
         session: The requests.Session to reuse connections (recommended).
         url: The URL to fetch.
         retries: Number of search retries.
-        backoff: Backoff multiplier for retries.
+        backoff: Delay (in seconds) before the first retry, doubled for each later one.
         timeout: Time to timeout.
+        stream: If True, the response body is not downloaded up front (the caller
+            reads it with iter_content and must close the response).
 
     Returns:
         Optional[requests.Response]: Response object if successful, None if all retries failed
@@ -208,19 +366,26 @@ def _fetch_page(
     # Iterate 3 times (by default)
     for attempt in range(1, retries + 1):
         try:
-            # Get response
-            response = session.get(url, timeout=timeout)
+            # Wait for the rate limiter, then get response
+            _RATE_LIMITER.acquire()
+            response = session.get(url, timeout=timeout, stream=stream)
             # If OK, return response
             if response.status_code == 200:
+                _RATE_LIMITER.speed_up()
                 return response
-            # If 'too many requests' or 'unavailable', wait a bit and continue
+            # If 'too many requests' or 'unavailable', slow down, wait and continue
             elif response.status_code in (429, 503):
                 logger.warning(
                     " Rate-limited or service unavailable (status %s) for %s. Backing off",
                     response.status_code,
                     url,
                 )
-                time.sleep(backoff * attempt)
+                _RATE_LIMITER.slow_down()
+                response.close()
+                if attempt < retries:
+                    time.sleep(
+                        retry_after_delay(response, backoff_delay(backoff, attempt))
+                    )
             # If error, return response
             else:
                 logger.debug(" Non-200 status %s for %s", response.status_code, url)
@@ -229,10 +394,30 @@ def _fetch_page(
             logger.warning(
                 " Request failed (attempt %s/%s) for %s: %s", attempt, retries, url, e
             )
-            time.sleep(backoff * attempt)
+            if attempt < retries:
+                time.sleep(backoff_delay(backoff, attempt))
     return None
 
 
+def _fetch_search_page(
+    session: requests.Session, url: str
+) -> Optional[requests.Response]:
+    """
+    Fetch a search page (logged, so it can also run on the prefetch thread).
+
+    Args:
+        session: The requests.Session to reuse connections (recommended).
+        url: The search URL to fetch.
+
+    Returns:
+        Optional[requests.Response]: Response object if successful, None if all retries failed
+    """
+
+    logger.info(" Fetching Jobly search page: %s", url)
+
+    return _fetch_page(session, url)
+
+
 def _parse_job_card(job_card: BeautifulSoup) -> Dict:
     """
     Parse a search-result job card into a partial job dict
@@ -246,60 +431,62 @@ def _parse_job_card(job_card: BeautifulSoup) -> Dict:
         Dict: The dictionary with job information.
     """
 
+    # Find the tags of all fields in a single walk over the card
+    # Each field takes the first matching tag in document order, like select_one would,
+    # instead of evaluating every selector of every field against the whole card
+    title_tag = company_tag = location_tag = None
+    link_tag = published_tag = snippet_tag = None
+    for tag in job_card.find_all(True):
+        attrs = tag.attrs
+        classes = attrs.get("class") or ()
+        if title_tag is None and _TITLE_CLASS in classes:
+            title_tag = tag
+        if company_tag is None and (
+            "data-company" in attrs or not _COMPANY_CLASSES.isdisjoint(classes)
+        ):
+            company_tag = tag
+        if location_tag is None and (
+            "data-location" in attrs or not _LOCATION_CLASSES.isdisjoint(classes)
+        ):
+            location_tag = tag
+        if (
+            link_tag is None
+            and tag.name == "a"
+            and _JOB_HREF_RE.search(attrs.get("href", ""))
+        ):
+            link_tag = tag
+        if published_tag is None and (
+            tag.name == "time"
+            or "data-date" in attrs
+            or not _PUBLISHED_CLASSES.isdisjoint(classes)
+        ):
+            published_tag = tag
+        if snippet_tag is None and not _SNIPPET_CLASSES.isdisjoint(classes):
+            snippet_tag = tag
+
     # Parse title from job card
-    title_tag = job_card.select_one(".node__title")
     title = title_tag.get_text(strip=True) if title_tag else ""
 
     # Parse company from job card
-    company_tag = job_card.select_one(
-        ".company-name, .company, [data-company], .employer"
-    )
-    company = (
-        company_tag.get_text(strip=True)
-        if company_tag
-        else (
-            company_tag.get("data-company")
-            if company_tag and hasattr(company_tag, "get")
-            else ""
-        )
-    )
+    company = company_tag.get_text(strip=True) if company_tag else ""
 
     # Parse location from job card
-    location_tag = job_card.select_one(
-        ".location, .job-location, [data-location], .city, .region"
-    )
     location = location_tag.get_text(strip=True) if location_tag else ""
 
     # Parse URL from job card
-    # Try to find link to job detail page
-    url_tag = (
-        job_card.select_one("a[href*='/jobs/'], a[href*='/job/']")
-        or job_card.find("a", href=re.compile(r"/jobs/|/job/"))
-        or title_tag  # Fallback to title link if it exists
-    )
-    href = url_tag.get("href") if url_tag and url_tag.has_attr("href") else ""
-    full_url = urljoin(HOST_URL_JOBLY, href) if href else ""
+    # Link to job detail page, fallback to title link if it exists
+    url_tag = link_tag or title_tag
+    href = url_tag.get("href", "") if url_tag else ""
+    if href[:1] == "/" and not _URLJOIN_NEEDED_RE.search(href):
+        full_url = HOST_URL_JOBLY + href
+    else:
+        full_url = urljoin(HOST_URL_JOBLY, href) if href else ""
 
     # Parse published date from job card
-    # Try multiple selectors for date
-    published_tag = job_card.select_one(
-        ".date, .published, .posted, [data-date], .job-date, time"
-    )
-    published = (
-        published_tag.get_text(strip=True)
-        if published_tag
-        else (
-            published_tag.get("datetime")
-            if published_tag and published_tag.has_attr("datetime")
-            else ""
-        )
-    )
+    published = published_tag.get_text(strip=True) if published_tag else ""
 
     # Parse description snippet if available
-    snippet_tag = job_card.select_one(
-        ".description, .snippet, .summary, .job-description"
-    )
-    snippet = snippet_tag.get_text(strip=True) if snippet_tag else None
+    snippet = snippet_tag.get_text(strip=True) if snippet_tag else ""
 
     return {
         "title": title,
@@ -312,6 +499,61 @@ def _parse_job_card(job_card: BeautifulSoup) -> Dict:
     }
 
 
+def _fetch_full_job_descriptions(
+    session: requests.Session,
+    jobs: List[Dict],
+    cancellation_check: Optional[Callable[[], bool]] = None,
+    detail_cache: Optional[Dict[str, str]] = None,
+) -> None:
+    """
+    Fetch the full job descriptions for a page of jobs concurrently (deep mode).
+
+    The detail pages are fetched by a small thread pool sharing the session's
+    connection pool. Each URL is fetched at most once, and URLs already in
+    detail_cache are not fetched at all. The descriptions are stored in the job
+    dictionaries in place.
+
+    Args:
+        session: The requests.Session to reuse connections (recommended).
+        jobs: The job dictionaries parsed from a search page.
+        cancellation_check: Optional callable that returns True if the operation
+            should be cancelled. Checked before each job detail fetch.
+        detail_cache: Optional dictionary of job URL -> full description.
+
+    Raises:
+        CancellationError: If cancellation_check returns True during execution
+    """
+
+    if detail_cache is None:
+        detail_cache = {}
+
+    def fetch(url: str) -> str:
+        # Check for cancellation before each job detail fetch
+        if cancellation_check and cancellation_check():
+            logger.info(" Jobly scraping cancelled by user")
+            raise CancellationError("Pipeline cancelled during job search")
+        try:
+            return _fetch_full_job_description(session, url)
+        except Exception as e:
+            logger.warning(" Error fetching detail for %s: %s", url, e)
+            return ""
+
+    # Unique URLs that have not been fetched before (in first-seen order)
+    urls = list(
+        dict.fromkeys(
+            job["url"]
+            for job in jobs
+            if job.get("url") and job["url"] not in detail_cache
+        )
+    )
+    with ThreadPoolExecutor(max_workers=DETAIL_FETCH_WORKERS) as executor:
+        detail_cache.update(zip(urls, executor.map(fetch, urls)))
+
+    for job in jobs:
+        if job.get("url"):
+            job["full_description"] = detail_cache[job["url"]]
+
+
 def _fetch_full_job_description(
     session: requests.Session, job_url: str, retries: int = 2
 ) -> str:
@@ -327,8 +569,8 @@ def _fetch_full_job_description(
         str: The full job description text, or an empty string if the description is not found.
     """
 
-    # Get response safely
-    response = _fetch_page(session, job_url, retries=retries)
+    # Get response safely (the body is downloaded below)
+    response = _fetch_page(session, job_url, retries=retries, stream=True)
 
     if not response or response.status_code != 200:
         logger.debug(
@@ -336,32 +578,127 @@ def _fetch_full_job_description(
             job_url,
             getattr(response, "status_code", None),
         )
+        if response is not None:
+            response.close()
         return ""
 
-    # Parse the HTML text with a HTML parser
-    soup = BeautifulSoup(response.text, "html.parser")
+    try:
+        # Download the page only until the description element has been received
+        # (the rest of the page, often most of it, is never downloaded or parsed)
+        chunks = response.iter_content(DETAIL_CHUNK_SIZE)
+        content, stopped_early = _read_until_description(chunks)
 
-    # Find the full job description
-    # Try multiple selectors for job description
-    description_tag = soup.select_one(
-        ".job-description, .description, .job-details, .content, .job-content, main article, [role='article']"
-    )
-    description = description_tag.get_text(strip=True) if description_tag else ""
+        # Parse the HTML with the lxml parser (a C extension)
+        # The raw bytes are handed to lxml, which decodes them while parsing
+        soup = BeautifulSoup(content, "lxml", from_encoding=response.encoding)
 
-    if description:
-        return description
+        # Find the full job description
+        # Try multiple selectors for job description
+        description_tag = _DESCRIPTION_SELECTOR.select_one(soup)
+        description = description_tag.get_text(strip=True) if description_tag else ""
+
+        if description:
+            return description
+
+        if stopped_early:
+            # The description element has no text, so the fallback below needs
+            # the whole page
+            content += b"".join(chunks)
+            soup = BeautifulSoup(content, "lxml", from_encoding=response.encoding)
+    finally:
+        response.close()
 
     # Fallback: look for the longest text block (likely the description)
     # This is a last resort if standard selectors don't work
-    divs = soup.find_all(["div", "section", "article"])
+    # Only blocks with substantial text (over 100 characters) are considered
     best_guess = ""
-    longest = 0
+    longest = 100
 
-    for div in divs:
-        text_content = div.get_text(" ", strip=True)
-        # Look for divs with substantial text (likely descriptions)
-        if len(text_content) > longest and len(text_content) > 100:
-            longest = len(text_content)
+    for block in _iter_outermost_blocks(soup):
+        text_content = block.get_text(" ", strip=True)
+        text_length = len(text_content)
+        if text_length > longest:
+            longest = text_length
             best_guess = text_content
 
     return best_guess
+
+
+def _read_until_description(chunks: Iterator[bytes]) -> Tuple[bytes, bool]:
+    """
+    Read a page from chunks until the first description element has ended.
+
+    The chunks are fed to an incremental lxml parser, which reports elements as soon
+    as they start and end. Reading stops at the end of the first element (in document
+    order) matching the description selectors, the same element select_one finds.
+
+    Args:
+        chunks (Iterator[bytes]): The page content in chunks. The unread chunks
+            are left in the iterator.
+
+    Returns:
+        Tuple[bytes, bool]: The content read, and whether reading stopped early
+            (i.e. a description element was found before the end of the page).
+    """
+
+    parser = etree.HTMLPullParser(events=("start", "end"))
+    content = []
+    description_element = None
+
+    for chunk in chunks:
+        content.append(chunk)
+        parser.feed(chunk)
+        for event, element in parser.read_events():
+            if event == "start":
+                if description_element is None and _is_description_element(element):
+                    description_element = element
+            elif element is description_element:
+                return b"".join(content), True
+
+    return b"".join(content), False
+
+
+def _is_description_element(element: etree._Element) -> bool:
+    """
+    Check if an lxml element matches any of the selectors in _DESCRIPTION_SELECTOR.
+
+    Args:
+        element (etree._Element): The element to check (its ancestors must be parsed).
+
+    Returns:
+        bool: True if the element matches.
+    """
+
+    if element.get("role") == "article":
+        return True
+    classes = element.get("class")
+    if classes and not _DESCRIPTION_CLASSES.isdisjoint(classes.split()):
+        return True
+    return (
+        element.tag == "article"
+        and next(element.iterancestors("main"), None) is not None
+    )
+
+
+def _iter_outermost_blocks(root: Tag) -> Iterator[Tag]:
+    """
+    Yield the outermost text blocks (div, section, article) in document order.
+
+    A nested block's text is part of its enclosing block's text, so it can never be
+    longer than the enclosing block. Blocks are therefore not descended into, and
+    each element of the page is visited once.
+
+    Args:
+        root (Tag): The element to search under.
+
+    Returns:
+        Iterator[Tag]: The outermost block elements.
+    """
+
+    for child in root.children:
+        if not isinstance(child, Tag):
+            continue
+        if child.name in _BLOCK_TAGS:
+            yield child
+        else:
+            yield from _iter_outermost_blocks(child)
@@ -0,0 +1,81 @@
+# ---------- LLM CACHE TEST ----------
+
+import pytest
+
+import jobsai.utils.cache as cache
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Point the cache to a temporary directory and make sure it is enabled."""
+    monkeypatch.setattr(cache, "LLM_CACHE_PATH", tmp_path)
+    monkeypatch.delenv("JOBSAI_NO_CACHE", raising=False)
+    return tmp_path
+
+
+def make_counter():
+    calls = []
+
+    def func(data):
+        calls.append(data)
+        return f"result for {data}"
+
+    return func, calls
+
+
+def test_cache_key_is_order_independent():
+    assert cache.cache_key({"a": 1, "b": 2}) == cache.cache_key({"b": 2, "a": 1})
+    assert cache.cache_key({"a": 1}) != cache.cache_key({"a": 2})
+
+
+def test_cached_hit_skips_call():
+    func, calls = make_counter()
+    wrapped = cache.cached("profile", func)
+
+    assert wrapped({"x": 1}) == "result for {'x': 1}"
+    assert wrapped({"x": 1}) == "result for {'x': 1}"
+    assert len(calls) == 1
+
+
+def test_cached_miss_on_changed_input():
+    func, calls = make_counter()
+    wrapped = cache.cached("keywords", func)
+
+    wrapped("profile A")
+    wrapped("profile B")
+    assert calls == ["profile A", "profile B"]
+
+
+def test_cache_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("JOBSAI_NO_CACHE", "1")
+    func, calls = make_counter()
+    wrapped = cache.cached("profile", func)
+
+    wrapped("same")
+    wrapped("same")
+    assert len(calls) == 2
+
+
+def test_job_details_roundtrip():
+    cache.save_job_details({"https://a": "desc A", "https://b": ""})
+
+    # Empty descriptions (failed fetches) are not cached
+    assert cache.load_job_details() == {"https://a": "desc A"}
+
+
+def test_job_details_expire(monkeypatch):
+    cache.save_job_details({"https://a": "desc A"})
+    later = cache.time.time() + 2 * cache.JOB_DETAILS_MAX_AGE
+    monkeypatch.setattr(cache.time, "time", lambda: later)
+    cache.save_job_details({"https://b": "desc B"})
+
+    # The old entry keeps its original fetch time and expires
+    assert cache.load_job_details(max_age=60) == {"https://b": "desc B"}
+
+
+def test_save_leaves_no_temporary_files(cache_dir):
+    wrapped = cache.cached("test", lambda data: f"result for {data}")
+    wrapped("a")
+    wrapped("b")
+
+    assert sorted(p.suffix for p in cache_dir.iterdir()) == [".gz", ".gz"]
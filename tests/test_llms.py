@@ -0,0 +1,171 @@
+# ---------- LLM UTILITIES TEST ----------
+
+import os
+
+import httpx
+import pytest
+from openai import BadRequestError, InternalServerError
+
+# llms.py validates its configuration at import time
+os.environ.setdefault("OPENAI_MODEL", "test-model")
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+import jobsai.utils.llms as llms
+from jobsai.utils.llms import extract_json, extract_json_streaming
+from jobsai.utils.rate_limiter import MAX_RETRY_AFTER
+
+
+class ClosableChunks:
+    """Chunk source that records how far it was consumed and whether it was closed."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.consumed = 0
+        self.closed = False
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            self.consumed += 1
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+
+# ------------------------------------------------------------
+# extract_json
+# ------------------------------------------------------------
+
+
+def test_extract_json_from_markdown():
+    text = 'Here is the profile: ```json\n{"name": "John"}\n```'
+    assert extract_json(text) == '{"name": "John"}'
+
+
+def test_extract_json_nested():
+    text = 'prefix {"a": {"b": 1}, "c": 2} suffix'
+    assert extract_json(text) == '{"a": {"b": 1}, "c": 2}'
+
+
+def test_extract_json_no_object():
+    assert extract_json("no json here") is None
+
+
+# ------------------------------------------------------------
+# extract_json_streaming
+# ------------------------------------------------------------
+
+
+def test_extract_json_streaming_across_chunks():
+    chunks = ["Sure! ```json\n{\"na", 'me": {"first": "Jo', 'hn"}}', "\n```"]
+    assert extract_json_streaming(chunks) == '{"name": {"first": "John"}}'
+
+
+def test_extract_json_streaming_stops_early_and_closes():
+    source = ClosableChunks(['{"a": 1}', " trailing", " tokens"])
+    assert extract_json_streaming(source) == '{"a": 1}'
+    assert source.consumed == 1
+    assert source.closed
+
+
+def test_extract_json_streaming_unbalanced():
+    assert extract_json_streaming(['{"a": ', "1"]) is None
+
+
+def test_extract_json_streaming_no_object():
+    assert extract_json_streaming(["no ", "json"]) is None
+
+
+# ------------------------------------------------------------
+# retry backoff
+# ------------------------------------------------------------
+
+
+class MockResponse:
+    def __init__(self, headers):
+        self.headers = headers
+
+
+class MockError(Exception):
+    def __init__(self, headers=None):
+        self.response = MockResponse(headers or {})
+
+
+def test_backoff_delay_is_jittered_exponential():
+    for attempt in range(3):
+        delay = llms._backoff_delay(MockError(), attempt, 1.0)
+        assert 0.5 * 2**attempt <= delay <= 1.5 * 2**attempt
+
+
+def test_backoff_delay_is_capped():
+    assert llms._backoff_delay(MockError(), 20, 1.0) <= 1.5 * llms.MAX_RETRY_DELAY
+
+
+def test_backoff_delay_honors_retry_after():
+    assert llms._backoff_delay(MockError({"Retry-After": "7"}), 0, 1.0) == 7
+
+
+def test_backoff_delay_caps_retry_after():
+    delay = llms._backoff_delay(MockError({"Retry-After": "86400"}), 0, 1.0)
+    assert delay == MAX_RETRY_AFTER
+
+
+def test_backoff_delay_ignores_negative_retry_after():
+    assert llms._backoff_delay(MockError({"Retry-After": "-5"}), 0, 1.0) == 0
+
+
+# ------------------------------------------------------------
+# retried errors
+# ------------------------------------------------------------
+
+
+def api_error(error_class, status):
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(status, request=request)
+    return error_class(f"HTTP {status}", response=response, body=None)
+
+
+class MockCompletions:
+    """Raises the given errors in turn, then returns a completion."""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        message = type("Message", (), {"content": "ok"})()
+        choice = type("Choice", (), {"message": message})()
+        return type("Completion", (), {"choices": [choice]})()
+
+
+def use_completions(monkeypatch, completions):
+    chat = type("Chat", (), {"completions": completions})()
+    monkeypatch.setattr(llms, "completion_client", type("Client", (), {"chat": chat}))
+    sleeps = []
+    monkeypatch.setattr(llms.time, "sleep", sleeps.append)
+    return sleeps
+
+
+def test_call_llm_retries_server_errors_with_backoff(monkeypatch):
+    completions = MockCompletions(
+        [api_error(InternalServerError, 500), api_error(InternalServerError, 503)]
+    )
+    sleeps = use_completions(monkeypatch, completions)
+
+    assert llms.call_llm("system", "user", retry_delay=1.0) == "ok"
+    assert completions.calls == 3
+    assert 0.5 <= sleeps[0] <= 1.5
+    assert 1.0 <= sleeps[1] <= 3.0
+
+
+def test_call_llm_does_not_retry_client_errors(monkeypatch):
+    completions = MockCompletions([api_error(BadRequestError, 400)])
+    sleeps = use_completions(monkeypatch, completions)
+
+    with pytest.raises(BadRequestError):
+        llms.call_llm("system", "user")
+    assert completions.calls == 1
+    assert sleeps == []
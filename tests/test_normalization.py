@@ -0,0 +1,102 @@
+# ---------- NORMALIZATION TEST ----------
+
+import pytest
+
+from jobsai.utils.normalization import (
+    normalize_list,
+    normalize_parsed,
+    normalize_text,
+)
+
+
+# ------------------------------------------------------------
+# normalize_text
+# ------------------------------------------------------------
+
+
+def test_normalize_text_line_endings_and_trailing_spaces():
+    assert normalize_text("Hello  \r\nWorld\t\rEnd") == "Hello\nWorld\nEnd"
+
+
+def test_normalize_text_collapses_blank_lines():
+    text = "First\n\n\n\nSecond\n \n\t\n\nThird"
+    assert normalize_text(text) == "First\n\nSecond\n\nThird"
+
+
+def test_normalize_text_keeps_single_blank_line_and_indentation():
+    text = "Para one\n\n    indented line\nlast"
+    assert normalize_text(text) == text
+
+
+def test_normalize_text_strips_surrounding_blank_lines():
+    assert normalize_text("\n\n  Body text  \n\n\n") == "Body text"
+
+
+def test_normalize_text_non_string_passthrough():
+    assert normalize_text(None) is None
+
+
+# ------------------------------------------------------------
+# normalize_list
+# ------------------------------------------------------------
+
+
+def test_normalize_list_aliases_and_capitalization():
+    items = ["py", "reactjs", "docker", "AWS", "TypeScript"]
+    assert normalize_list(items) == ["Python", "React", "Docker", "AWS", "TypeScript"]
+
+
+def test_normalize_list_deduplicates_preserving_order():
+    items = ["python", "Docker", "Python3", " docker ", "py"]
+    assert normalize_list(items) == ["Python", "Docker"]
+
+
+def test_normalize_list_skips_empty_and_non_strings():
+    assert normalize_list(["", "   ", None, 3, "rust"]) == ["Rust"]
+
+
+def test_normalize_list_all_strings_matches_checked_path():
+    items = ["py", "", "Docker", " docker ", "rust"]
+    assert normalize_list(items, all_strings=True) == normalize_list(items)
+
+
+# ------------------------------------------------------------
+# normalize_parsed
+# ------------------------------------------------------------
+
+
+def test_normalize_parsed_fills_missing_keys():
+    parsed = normalize_parsed({})
+    assert parsed["name"] == ""
+    assert parsed["core_languages"] == []
+    assert parsed["job_search_keywords"] == []
+    assert parsed["experience_level"] == {
+        "Python": 0,
+        "JavaScript": 0,
+        "Agentic AI": 0,
+        "AI/ML": 0,
+    }
+
+
+def test_normalize_parsed_normalizes_values():
+    parsed = normalize_parsed(
+        {
+            "name": "  Joni  ",
+            "core_languages": ["py", "js", "python"],
+            "soft_skills": "not a list",
+            "experience_level": {"Python": "3", "Agentic_Ai": 2, "AI_ML": None},
+        }
+    )
+    assert parsed["name"] == "Joni"
+    assert parsed["core_languages"] == ["Python", "JavaScript"]
+    assert parsed["soft_skills"] == []
+    assert parsed["experience_level"] == {
+        "Python": 3,
+        "JavaScript": 0,
+        "Agentic AI": 2,
+        "AI/ML": 0,
+    }
+
+
+def test_normalize_parsed_invalid_name():
+    assert normalize_parsed({"name": 42})["name"] == ""
@@ -0,0 +1,57 @@
+# ---------- QUERY BUILDER AGENT TEST ----------
+
+import os
+
+# The agents package imports llms.py, which validates its configuration at import time
+os.environ.setdefault("OPENAI_MODEL", "test-model")
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+import jobsai.agents.query_builder as query_builder
+from jobsai.agents.query_builder import QueryBuilderAgent
+
+
+class MockStream:
+    """Chunk stream that records how far it was consumed and whether it was closed."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.consumed = 0
+        self.closed = False
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            self.consumed += 1
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+
+def test_create_keywords_streams_the_json_response(monkeypatch):
+    stream = MockStream(['{"q1": "ai eng', 'ineer", "q2": "software engineer"}', "!"])
+    calls = []
+
+    def fake_call_llm(system_prompt, user_prompt, **kwargs):
+        calls.append(kwargs)
+        return stream
+
+    monkeypatch.setattr(query_builder, "call_llm", fake_call_llm)
+
+    keywords = QueryBuilderAgent().create_keywords("profile")
+
+    assert keywords == ["ai engineer", "software engineer"]
+    assert calls[0]["stream"] is True
+    # The stream is closed once the JSON object is complete
+    assert stream.consumed == 2
+    assert stream.closed
+
+
+def test_create_keywords_retries_when_stream_has_no_json(monkeypatch):
+    streams = iter(
+        [MockStream(["no json here"]), MockStream(['{"q1": "ai engineer"}'])]
+    )
+    monkeypatch.setattr(
+        query_builder, "call_llm", lambda *args, **kwargs: next(streams)
+    )
+
+    assert QueryBuilderAgent().create_keywords("profile") == ["ai engineer"]
@@ -0,0 +1,113 @@
+# ---------- RATE LIMITER TESTS ----------
+
+import pytest
+
+from unittest.mock import patch
+
+from jobsai.utils.rate_limiter import (
+    TokenBucket,
+    backoff_delay,
+    retry_after_delay,
+    MAX_BACKOFF,
+    MAX_RETRY_AFTER,
+)
+
+
+# ------------------------------------------------------------
+# Fake clock
+# ------------------------------------------------------------
+
+
+class FakeClock:
+    """Monotonic clock that only advances when sleeping."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    clock = FakeClock()
+    with patch("time.monotonic", clock.monotonic), patch("time.sleep", clock.sleep):
+        yield clock
+
+
+# ------------------------------------------------------------
+# TokenBucket
+# ------------------------------------------------------------
+
+
+def test_burst_is_not_delayed(clock):
+    bucket = TokenBucket(rate=2.0, burst=4)
+
+    for _ in range(4):
+        bucket.acquire()
+
+    assert clock.sleeps == []
+
+
+def test_requests_beyond_burst_wait_for_refill(clock):
+    bucket = TokenBucket(rate=2.0, burst=1)
+
+    bucket.acquire()
+    bucket.acquire()
+    bucket.acquire()
+
+    assert clock.sleeps == [0.5, 0.5]
+
+
+def test_slow_down_halves_rate_and_speed_up_recovers(clock):
+    bucket = TokenBucket(rate=2.0, burst=1, min_rate=0.75)
+
+    bucket.slow_down()
+    assert bucket.rate == 1.0
+    bucket.slow_down()
+    assert bucket.rate == 0.75
+
+    for _ in range(10):
+        bucket.speed_up()
+    assert bucket.rate == 2.0
+
+
+# ------------------------------------------------------------
+# retry_after_delay
+# ------------------------------------------------------------
+
+
+class ThrottledResponse:
+    def __init__(self, headers):
+        self.headers = headers
+
+
+def test_retry_after_delay_honors_header_in_seconds():
+    assert retry_after_delay(ThrottledResponse({"Retry-After": "2"}), 5.0) == 2.0
+    assert (
+        retry_after_delay(ThrottledResponse({"Retry-After": "3600"}), 5.0)
+        == MAX_RETRY_AFTER
+    )
+
+
+def test_retry_after_delay_falls_back_to_backoff():
+    assert retry_after_delay(ThrottledResponse({}), 5.0) == 5.0
+    date = "Wed, 21 Oct 2026 07:28:00 GMT"
+    assert retry_after_delay(ThrottledResponse({"Retry-After": date}), 5.0) == 5.0
+    assert retry_after_delay(None, 5.0) == 5.0
+
+
+# ------------------------------------------------------------
+# backoff_delay
+# ------------------------------------------------------------
+
+
+def test_backoff_delay_doubles_with_jitter():
+    for attempt, base in ((1, 1.0), (2, 2.0), (3, 4.0), (10, MAX_BACKOFF)):
+        for _ in range(20):
+            assert 0.5 * base <= backoff_delay(1.0, attempt) <= 1.5 * base
@@ -0,0 +1,540 @@
+# ---------- JOB BOARD SCRAPER TESTS ----------
+
+import pytest
+
+from unittest.mock import patch
+
+from bs4 import BeautifulSoup
+
+from jobsai.utils.scrapers import duunitori, jobly
+
+
+# ------------------------------------------------------------
+# Helpers for mock responses
+# ------------------------------------------------------------
+
+
+class MockResponse:
+    def __init__(self, text="", status=200, chunk_size=1024):
+        self.text = text
+        self.content = text.encode("utf-8")
+        self.status_code = status
+        self.headers = {}
+        self.encoding = "utf-8"
+        self.chunk_size = chunk_size
+        self.chunks_read = 0
+        self.closed = False
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.content), self.chunk_size):
+            self.chunks_read += 1
+            yield self.content[start : start + self.chunk_size]
+
+    def close(self):
+        self.closed = True
+
+
+class MockSession:
+    """Serves canned HTML by URL and records every requested URL."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.headers = {}
+        self.requested = []
+        self.responses = {}
+
+    def get(self, url, **kwargs):
+        self.requested.append(url)
+        if url in self.pages:
+            response = MockResponse(self.pages[url])
+        else:
+            response = MockResponse("", status=404)
+        self.responses[url] = response
+        return response
+
+
+@pytest.fixture(autouse=True)
+def no_sleep():
+    """Skip the politeness delays between requests."""
+    with patch("time.sleep"):
+        yield
+
+
+# ------------------------------------------------------------
+# Duunitori
+# ------------------------------------------------------------
+
+
+def duunitori_card(i):
+    return f"""
+    <div class="grid grid--middle job-box job-box--lg">
+      <a class="job-box__hover gtm-search-result" href="/tyopaikat/tyo/job-{i}"
+         data-company="Company {i}">
+        <h3 class="job-box__title">Python Developer {i}</h3>
+      </a>
+      <span class="job-box__job-location">Helsinki</span>
+      <span class="job-box__job-posted">Julkaistu 1.1.</span>
+    </div>"""
+
+
+def duunitori_page(ids):
+    cards = "".join(duunitori_card(i) for i in ids)
+    recommended = duunitori_card(999)
+    return f"""
+    <html><head><title>Duunitori</title></head><body>
+      <nav class="nav">menu</nav>
+      <div class="grid-sandbox grid-sandbox--tight-bottom grid-sandbox--tight-top">
+        {cards}
+      </div>
+      <h2>Duunitori suosittelee</h2>
+      <div class="grid-sandbox">{recommended}</div>
+    </body></html>"""
+
+
+def duunitori_search_url(page):
+    return f"https://duunitori.fi/tyopaikat/haku/python-developer?sivu={page}"
+
+
+def duunitori_detail_url(i):
+    return f"https://duunitori.fi/tyopaikat/tyo/job-{i}"
+
+
+def test_duunitori_parses_search_results():
+    session = MockSession({duunitori_search_url(1): duunitori_page(range(20))})
+
+    jobs = duunitori.scrape_duunitori(
+        "Python  Developer", num_pages=1, deep_mode=False, session=session
+    )
+
+    assert len(jobs) == 20
+    assert jobs[0] == {
+        "title": "Python Developer 0",
+        "company": "Company 0",
+        "location": "Helsinki",
+        "url": duunitori_detail_url(0),
+        "description_snippet": "",
+        "published_date": "Julkaistu 1.1.",
+        "source": "duunitori",
+        "full_description": "",
+        "query_used": "Python  Developer",
+    }
+    # Cards in the "Duunitori suosittelee" section are ignored
+    assert duunitori_detail_url(999) not in [job["url"] for job in jobs]
+
+
+def test_duunitori_parse_job_card_missing_fields():
+    soup = BeautifulSoup(
+        '<div class="job-box"><h3 class="job-box__title">Only title</h3></div>',
+        "lxml",
+    )
+
+    job = duunitori._parse_job_card(soup.div)
+
+    assert job["title"] == "Only title"
+    assert job["company"] == ""
+    assert job["location"] == ""
+    assert job["url"] == ""
+    assert job["published_date"] == ""
+
+
+def test_duunitori_deep_mode_fetches_descriptions():
+    pages = {duunitori_search_url(1): duunitori_page(range(20))}
+    for i in range(20):
+        pages[duunitori_detail_url(i)] = (
+            f'<html><body><div class="description">Description {i}</div></body></html>'
+        )
+    session = MockSession(pages)
+
+    jobs = duunitori.scrape_duunitori(
+        "python developer", num_pages=1, deep_mode=True, session=session
+    )
+
+    assert [job["full_description"] for job in jobs] == [
+        f"Description {i}" for i in range(20)
+    ]
+
+
+def test_duunitori_per_page_limit_skips_extra_detail_fetches():
+    pages = {duunitori_search_url(1): duunitori_page(range(20))}
+    for i in range(20):
+        pages[duunitori_detail_url(i)] = (
+            f'<html><body><div class="description">Description {i}</div></body></html>'
+        )
+    session = MockSession(pages)
+
+    jobs = duunitori.scrape_duunitori(
+        "python developer",
+        num_pages=1,
+        deep_mode=True,
+        session=session,
+        per_page_limit=5,
+    )
+
+    assert len(jobs) == 5
+    assert duunitori_detail_url(5) not in session.requested
+
+
+def test_duunitori_detail_download_stops_after_description():
+    footer = "<div class='footer'>" + "Footer text. " * 2000 + "</div>"
+    pages = {duunitori_search_url(1): duunitori_page(range(20))}
+    pages[duunitori_detail_url(0)] = (
+        "<html><body><div class='description'>Write <b>Python</b></div>"
+        + footer
+        + "</body></html>"
+    )
+    session = MockSession(pages)
+
+    jobs = duunitori.scrape_duunitori(
+        "python developer",
+        num_pages=1,
+        deep_mode=True,
+        session=session,
+        per_page_limit=1,
+    )
+
+    assert jobs[0]["full_description"] == "WritePython"
+    detail_response = session.responses[duunitori_detail_url(0)]
+    assert detail_response.chunks_read == 1
+    assert detail_response.closed
+
+
+def test_duunitori_detail_cache_is_shared_between_queries():
+    other_search_url = "https://duunitori.fi/tyopaikat/haku/ml-engineer?sivu=1"
+    pages = {
+        duunitori_search_url(1): duunitori_page(range(20)),
+        other_search_url: duunitori_page(range(10, 30)),
+    }
+    for i in range(30):
+        pages[duunitori_detail_url(i)] = (
+            f'<html><body><div class="description">Description {i}</div></body></html>'
+        )
+    session = MockSession(pages)
+    detail_cache = {}
+
+    duunitori.scrape_duunitori(
+        "python developer",
+        num_pages=1,
+        session=session,
+        detail_cache=detail_cache,
+    )
+    jobs = duunitori.scrape_duunitori(
+        "ml engineer", num_pages=1, session=session, detail_cache=detail_cache
+    )
+
+    assert jobs[0]["full_description"] == "Description 10"
+    assert len(detail_cache) == 30
+    # Every detail page was fetched exactly once
+    detail_requests = [url for url in session.requested if "/tyo/" in url]
+    assert sorted(detail_requests) == sorted(duunitori_detail_url(i) for i in range(30))
+
+
+def test_duunitori_skips_jobs_listed_on_several_pages():
+    session = MockSession(
+        {
+            duunitori_search_url(1): duunitori_page(range(20)),
+            duunitori_search_url(2): duunitori_page(range(15, 35)),
+        }
+    )
+
+    jobs = duunitori.scrape_duunitori(
+        "python developer", num_pages=2, deep_mode=False, session=session
+    )
+
+    urls = [job["url"] for job in jobs]
+    assert urls == [duunitori_detail_url(i) for i in range(35)]
+
+
+def test_duunitori_paginates_until_short_page():
+    session = MockSession(
+        {
+            duunitori_search_url(1): duunitori_page(range(20)),
+            duunitori_search_url(2): duunitori_page(range(20, 40)),
+            duunitori_search_url(3): duunitori_page([]),
+        }
+    )
+
+    jobs = duunitori.scrape_duunitori(
+        "python developer", num_pages=5, deep_mode=False, session=session
+    )
+
+    assert len(jobs) == 40
+    assert duunitori_search_url(4) not in session.requested
+
+
+def test_duunitori_keeps_jobs_from_short_last_page():
+    session = MockSession(
+        {
+            duunitori_search_url(1): duunitori_page(range(20)),
+            duunitori_search_url(2): duunitori_page(range(20, 25)),
+        }
+    )
+
+    jobs = duunitori.scrape_duunitori(
+        "python developer", num_pages=5, deep_mode=False, session=session
+    )
+
+    # The 5 jobs on the short last page are kept, and pagination stops there
+    assert len(jobs) == 25
+    assert duunitori_search_url(3) not in session.requested
+
+
+def test_duunitori_does_not_parse_pages_without_job_cards():
+    session = MockSession(
+        {duunitori_search_url(1): "<html><body><p>Ei tuloksia</p></body></html>"}
+    )
+
+    with patch.object(duunitori, "BeautifulSoup") as soup:
+        jobs = duunitori.scrape_duunitori(
+            "python developer", num_pages=5, deep_mode=False, session=session
+        )
+
+    assert jobs == []
+    soup.assert_not_called()
+
+
+def test_duunitori_prefetches_only_pages_that_are_used():
+    session = MockSession(
+        {
+            duunitori_search_url(1): duunitori_page(range(20)),
+            duunitori_search_url(2): duunitori_page(range(20, 40)),
+        }
+    )
+
+    jobs = duunitori.scrape_duunitori(
+        "python developer",
+        num_pages=5,
+        deep_mode=False,
+        session=session,
+        per_page_limit=30,
+    )
+
+    assert len(jobs) == 30
+    assert session.requested == [duunitori_search_url(1), duunitori_search_url(2)]
+
+
+def test_iter_duunitori_yields_jobs_page_by_page():
+    session = MockSession(
+        {
+            duunitori_search_url(1): duunitori_page(range(20)),
+            duunitori_search_url(2): duunitori_page(range(20, 40)),
+        }
+    )
+
+    jobs = duunitori.iter_duunitori(
+        "python developer", num_pages=2, deep_mode=False, session=session
+    )
+    first = next(jobs)
+
+    assert first["title"] == "Python Developer 0"
+    assert len(list(jobs)) == 39
+
+
+def test_duunitori_fetch_page_waits_for_retry_after():
+    throttled = MockResponse("", status=429)
+    throttled.headers["Retry-After"] = "3"
+    session = MockSession({})
+    session.get = lambda url, **kwargs: responses.pop(0)
+    responses = [throttled, MockResponse("ok")]
+
+    with patch("time.sleep") as sleep:
+        response = duunitori._fetch_page(session, "https://duunitori.fi/x")
+
+    assert response.text == "ok"
+    sleep.assert_any_call(3.0)
+
+
+# ------------------------------------------------------------
+# Jobly
+# ------------------------------------------------------------
+
+
+def jobly_card(i):
+    return f"""
+    <div class="job__content clearfix">
+      <h2 class="node__title"><a href="/en/job/job-{i}">AI Engineer {i}</a></h2>
+      <span class="recruiter-company-profile-job-organization">
+        <a href="/en/company/x">Company {i}</a>
+      </span>
+      <div class="location">Espoo</div>
+      <span class="date">2.1.2026</span>
+    </div>"""
+
+
+def jobly_page(ids):
+    cards = "".join(jobly_card(i) for i in ids)
+    return f"<html><body><main>{cards}</main></body></html>"
+
+
+def jobly_search_url(page):
+    return f"https://www.jobly.fi/en/jobs?search=ai+engineer&page={page}"
+
+
+def jobly_detail_url(i):
+    return f"https://www.jobly.fi/en/job/job-{i}"
+
+
+def test_jobly_parses_search_results():
+    session = MockSession({jobly_search_url(1): jobly_page(range(3))})
+
+    jobs = jobly.scrape_jobly(
+        "ai engineer", num_pages=3, deep_mode=False, session=session
+    )
+
+    assert len(jobs) == 3
+    assert jobs[0]["title"] == "AI Engineer 0"
+    assert jobs[0]["location"] == "Espoo"
+    assert jobs[0]["url"] == jobly_detail_url(0)
+    assert jobs[0]["published_date"] == "2.1.2026"
+    assert jobs[0]["source"] == "jobly"
+    assert jobs[0]["query_used"] == "ai engineer"
+    # Fewer than 10 cards means there is no next page
+    assert jobly_search_url(2) not in session.requested
+
+
+def test_jobly_deep_mode_fetches_descriptions():
+    pages = {jobly_search_url(1): jobly_page(range(2))}
+    pages[jobly_detail_url(0)] = (
+        '<html><body><div class="job-description">Build agents</div></body></html>'
+    )
+    pages[jobly_detail_url(1)] = (
+        "<html><body><nav>x</nav><section>" + "Long text. " * 20 + "</section>"
+        "</body></html>"
+    )
+    session = MockSession(pages)
+
+    jobs = jobly.scrape_jobly(
+        "ai engineer", num_pages=1, deep_mode=True, session=session
+    )
+
+    assert jobs[0]["full_description"] == "Build agents"
+    # Falls back to the longest text block when no description selector matches
+    assert jobs[1]["full_description"] == ("Long text. " * 20).strip()
+
+
+def test_jobly_skips_jobs_listed_on_several_pages():
+    pages = {
+        jobly_search_url(1): jobly_page(range(10)),
+        jobly_search_url(2): jobly_page(range(8, 14)),
+    }
+    for i in range(14):
+        pages[jobly_detail_url(i)] = (
+            f'<html><body><div class="job-description">Job {i}</div></body></html>'
+        )
+    session = MockSession(pages)
+
+    jobs = jobly.scrape_jobly(
+        "ai engineer", num_pages=2, deep_mode=True, session=session
+    )
+
+    urls = [job["url"] for job in jobs]
+    assert urls == [jobly_detail_url(i) for i in range(14)]
+    # The repeated jobs' detail pages are fetched only once
+    assert session.requested.count(jobly_detail_url(8)) == 1
+
+
+def test_jobly_prefetches_only_pages_that_are_used():
+    session = MockSession(
+        {
+            jobly_search_url(1): jobly_page(range(10)),
+            jobly_search_url(2): jobly_page(range(10, 14)),
+        }
+    )
+
+    jobs = jobly.scrape_jobly(
+        "ai engineer", num_pages=5, deep_mode=False, session=session
+    )
+
+    assert [job["title"] for job in jobs] == [f"AI Engineer {i}" for i in range(14)]
+    assert jobly_search_url(3) not in session.requested
+
+
+def test_jobly_detail_download_stops_after_description():
+    footer = "<div class='footer'>" + "Footer text. " * 2000 + "</div>"
+    pages = {jobly_search_url(1): jobly_page(range(1))}
+    pages[jobly_detail_url(0)] = (
+        "<html><body><main><article><div class='content'>Build <b>agents</b></div>"
+        "<p>More</p></article></main>" + footer + "</body></html>"
+    )
+    session = MockSession(pages)
+
+    jobs = jobly.scrape_jobly(
+        "ai engineer", num_pages=1, deep_mode=True, session=session
+    )
+
+    # The first matching element in document order is main article
+    assert jobs[0]["full_description"] == "BuildagentsMore"
+    detail_response = session.responses[jobly_detail_url(0)]
+    assert detail_response.chunks_read == 1
+    assert detail_response.closed
+
+
+def test_jobly_detail_empty_description_falls_back_to_whole_page():
+    body = "<div><section>" + "Long text. " * 2000 + "</section></div>"
+    html = f"<html><body><div class='description'> </div>{body}</body></html>"
+    pages = {jobly_search_url(1): jobly_page(range(1))}
+    pages[jobly_detail_url(0)] = html
+    session = MockSession(pages)
+
+    jobs = jobly.scrape_jobly(
+        "ai engineer", num_pages=1, deep_mode=True, session=session
+    )
+
+    assert jobs[0]["full_description"] == ("Long text. " * 2000).strip()
+
+
+def test_jobly_detail_without_charset_uses_the_page_meta_charset():
+    html = (
+        '<html><head><meta charset="iso-8859-1"></head><body>'
+        '<div class="job-description">Työpaikka Helsingissä</div></body></html>'
+    )
+    response = MockResponse()
+    response.content = html.encode("iso-8859-1")
+    # No charset in the Content-Type header
+    response.encoding = None
+    session = MockSession({})
+    session.get = lambda url, **kwargs: response
+
+    description = jobly._fetch_full_job_description(session, jobly_detail_url(0))
+
+    assert description == "Työpaikka Helsingissä"
+
+
+def test_jobly_detail_cache_is_shared_between_queries():
+    other_search_url = "https://www.jobly.fi/en/jobs?search=ml+engineer&page=1"
+    pages = {
+        jobly_search_url(1): jobly_page(range(3)),
+        other_search_url: jobly_page(range(2, 5)),
+    }
+    for i in range(5):
+        pages[jobly_detail_url(i)] = (
+            f'<html><body><div class="job-description">Job {i}</div></body></html>'
+        )
+    session = MockSession(pages)
+    detail_cache = {}
+
+    jobly.scrape_jobly(
+        "ai engineer", num_pages=1, session=session, detail_cache=detail_cache
+    )
+    jobs = jobly.scrape_jobly(
+        "ml engineer", num_pages=1, session=session, detail_cache=detail_cache
+    )
+
+    assert [job["full_description"] for job in jobs] == ["Job 2", "Job 3", "Job 4"]
+    detail_requests = [url for url in session.requested if "/job/" in url]
+    assert sorted(detail_requests) == sorted(jobly_detail_url(i) for i in range(5))
+
+
+def test_iter_jobly_yields_jobs_page_by_page():
+    session = MockSession(
+        {
+            jobly_search_url(1): jobly_page(range(10)),
+            jobly_search_url(2): jobly_page(range(10, 12)),
+        }
+    )
+
+    jobs = jobly.iter_jobly("ai engineer", num_pages=2, deep_mode=False, session=session)
+    first = next(jobs)
+
+    assert first["title"] == "AI Engineer 0"
+    assert jobly_search_url(1) in session.requested
+    assert len(list(jobs)) == 11
@@ -0,0 +1,114 @@
+# ---------- SEARCHER SERVICE TEST ----------
+
+import os
+import time
+
+import pytest
+
+# The agents package imports llms.py, which validates its configuration at import time
+os.environ.setdefault("OPENAI_MODEL", "test-model")
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+import jobsai.agents.searcher as searcher
+from jobsai.agents.searcher import SearcherService
+from jobsai.utils.exceptions import CancellationError
+
+
+def make_scraper(board, delay):
+    """Return a stub scraper that sleeps for delay seconds before each query."""
+
+    def scrape(query, deep_mode=False, cancellation_check=None, detail_cache=None):
+        time.sleep(delay)
+        return [{"url": f"https://{board}/{query}", "title": f"{board} {query}"}]
+
+    return scrape
+
+
+@pytest.fixture(autouse=True)
+def no_raw_files(monkeypatch):
+    """Don't write raw job listings to disk."""
+    monkeypatch.setattr(SearcherService, "_save_raw_jobs", lambda *args: None)
+
+
+def test_merge_order_is_query_major_when_boards_finish_out_of_order(monkeypatch):
+    # Duunitori is listed first but finishes last
+    monkeypatch.setattr(searcher, "scrape_duunitori", make_scraper("duunitori", 0.05))
+    monkeypatch.setattr(searcher, "scrape_jobly", make_scraper("jobly", 0))
+
+    jobs = SearcherService("ts").search_jobs(
+        ["ai", "python"], ["Duunitori", "Jobly"], deep_mode=False
+    )
+
+    assert [job["url"] for job in jobs] == [
+        "https://duunitori/ai",
+        "https://jobly/ai",
+        "https://duunitori/python",
+        "https://jobly/python",
+    ]
+
+
+def test_duplicates_keep_first_occurrence_in_merge_order(monkeypatch):
+    def scrape_same(query, **kwargs):
+        return [{"url": "https://same", "title": query}]
+
+    monkeypatch.setattr(searcher, "scrape_duunitori", make_scraper("duunitori", 0.05))
+    monkeypatch.setattr(searcher, "scrape_jobly", scrape_same)
+
+    jobs = SearcherService("ts").search_jobs(
+        ["ai", "python"], ["Duunitori", "Jobly"], deep_mode=False
+    )
+
+    assert [job["title"] for job in jobs] == [
+        "duunitori ai",
+        "ai",
+        "duunitori python",
+    ]
+
+
+def test_board_listed_twice_is_searched_once(monkeypatch):
+    queries = []
+
+    def scrape(query, **kwargs):
+        queries.append(query)
+        return [{"url": f"https://jobly/{query}"}]
+
+    monkeypatch.setattr(searcher, "scrape_jobly", scrape)
+
+    jobs = SearcherService("ts").search_jobs(
+        ["ai", "python"], ["Jobly", "jobly"], deep_mode=False
+    )
+
+    assert queries == ["ai", "python"]
+    assert len(jobs) == 2
+
+
+def wait_for_cancellation(query, cancellation_check=None, **kwargs):
+    """Stub scraper that runs until its cancellation check returns True."""
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        if cancellation_check():
+            raise CancellationError("Pipeline cancelled during job search")
+        time.sleep(0.01)
+    return []
+
+
+@pytest.mark.parametrize(
+    "error", [RuntimeError("scraper failed"), CancellationError("cancelled")]
+)
+def test_failing_board_stops_the_search_immediately(monkeypatch, error):
+    def fail(query, **kwargs):
+        raise error
+
+    # The first board keeps crawling, the second one fails right away
+    monkeypatch.setattr(searcher, "scrape_jobly", wait_for_cancellation)
+    monkeypatch.setattr(searcher, "scrape_duunitori", fail)
+
+    start = time.monotonic()
+    with pytest.raises(type(error)) as raised:
+        SearcherService("ts").search_jobs(
+            ["ai"], ["Jobly", "Duunitori"], deep_mode=False
+        )
+
+    assert raised.value is error
+    # The error isn't held back until the first board's crawl has finished
+    assert time.monotonic() - start < 2